@@ -1,107 +1,168 @@
+import importlib
 import os
 import sys
-from flask import Flask, request, redirect, url_for
+import click
+from flask import Flask
 from flask_migrate import Migrate
-from flask_login import LoginManager, current_user
-from datetime import datetime
-import pytz  # Librería para manejo de zonas horarias
+from flask_login import LoginManager, login_required
+from sqlalchemy.orm import joinedload
+from datetime import timezone
+from zoneinfo import ZoneInfo
 from app.utils.permissions import Permissions, Profiles
 
-# Añadir el directorio raíz del proyecto a la ruta de Python para que
-# encuentre el módulo 'config' sin importar cómo se ejecute la app.
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from config import DevConfig
+try:
+    from config import DevConfig
+except ImportError:
+    # Añadir el directorio raíz del proyecto a la ruta de Python solo cuando
+    # 'config' no es importable (p.ej. al ejecutar desde otro directorio).
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from config import DevConfig
 from app.db import db
 
-# Importar modelos para que SQLAlchemy los reconozca al crear tablas
-from app.models.roles_models import Rol
-from app.models.protocolos_models import Protocolo
-from app.models.jerarquias_models import Jerarquia
-from app.models.juegos_models import Juego
-from app.models.torneos_models import Torneo
-from app.models.equipos_models import Equipo
-from app.models.usuarios_models import Usuario
-from app.models.registros_models import Registro
-from app.models.resultados_models import Resultado
+# Rutas de plantillas y estáticos, resueltas una sola vez al importar
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_TEMPLATE_DIR = os.path.join(_BASE_DIR, "templates")
+_STATIC_DIR = os.path.join(_BASE_DIR, "static")
+
+# Módulos de modelos: se importan en create_app() para que SQLAlchemy los
+# reconozca al crear tablas, sin cargarlos con un simple `import app`.
+_MODEL_MODULES = (
+    "app.models.roles_models",
+    "app.models.protocolos_models",
+    "app.models.jerarquias_models",
+    "app.models.juegos_models",
+    "app.models.torneos_models",
+    "app.models.equipos_models",
+    "app.models.usuarios_models",
+    "app.models.registros_models",
+    "app.models.resultados_models",
+)
+
+# Blueprints registrados por create_app(): (módulo, nombre del blueprint, url_prefix)
+_BLUEPRINTS = (
+    ("app.routes.index_routes", "inicio_bp", None),
+    ("app.routes.roles_routes", "rol_bp", "/roles"),
+    ("app.routes.protocolos_routes", "protocolo_bp", "/protocolos"),
+    ("app.routes.jerarquias_routes", "jerarquia_bp", "/jerarquias"),
+    ("app.routes.juegos_routes", "juegos_bp", "/juegos"),
+    ("app.routes.torneos_routes", "torneos_bp", "/torneos"),
+    ("app.routes.equipos_routes", "equipos_bp", "/equipos"),
+    ("app.routes.usuarios_routes", "usuarios_bp", "/usuarios"),
+    ("app.routes.registros_routes", "registros_bp", "/registros"),
+    ("app.routes.auth_routes", "auth_bp", "/auth"),
+)
+
+# Zonas horarias resueltas una sola vez al importar (Ej: 'Europe/Madrid', 'America/Bogota')
+# https://en.wikipedia.org/wiki/List_of_tz_database_time_zones
+_LOCAL_TZ = ZoneInfo("Europe/Madrid")
+_UTC = timezone.utc
+
+# Formatos por defecto de los filtros de fecha/hora
+_FORMATO_HORA = "%H:%M:%S"
+_FORMATO_FECHA = "%Y-%m-%d %H:%M"
+
+# Blueprints cuyas vistas no requieren sesión iniciada
+_PUBLIC_BLUEPRINTS = frozenset({"auth"})
+
+# Contexto inmutable inyectado en todas las plantillas (Flask no lo modifica)
+_PERM_CTX = {"Permissions": Permissions, "Profiles": Profiles}
+
+
+def _a_hora_local(dt):
+    """Convierte un datetime (naive = UTC, estándar en BD) a la zona local."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_LOCAL_TZ)
+
+
+def _register_models():
+    """Importa todos los módulos de modelos para registrar sus mappers."""
+    for module_name in _MODEL_MODULES:
+        importlib.import_module(module_name)
 
 
 def create_app(config_class=DevConfig):
-    app = Flask(__name__)
+    app = Flask(__name__, template_folder=_TEMPLATE_DIR, static_folder=_STATIC_DIR)
     app.config.from_object(config_class)
     db.init_app(app)
+    _register_models()
     migrate = Migrate(app, db)
 
     # --- CONFIGURACIÓN DE FLASK-LOGIN ---
     login_manager = LoginManager()
     login_manager.init_app(app)
     login_manager.login_view = "auth.login"
-    login_manager.login_message = (
-        "ACCESO DENEGADO: Credenciales requeridas para este sector."
-    )
-    login_manager.login_message_category = "warning"
+    # Sin flash al redirigir al login: cada vista protegida visitada sin sesión
+    # encolaría el mismo aviso y se mostraría repetido tras iniciar sesión.
+    login_manager.login_message = None
+    # "basic" no regenera el identificador de sesión en cada petición
+    login_manager.session_protection = "basic"
+
+    from app.models.jerarquias_models import Jerarquia
+    from app.models.usuarios_models import Usuario
 
     @login_manager.user_loader
     def load_user(user_id):
-        # Recarga el objeto usuario desde el ID almacenado en la sesión
-        return db.session.get(Usuario, int(user_id))
+        # Recarga el usuario junto con su jerarquía (usada por permisos y menús)
+        # en una sola consulta. Flask-Login ya lo guarda en `g` por petición.
+        # Los protocolos de la jerarquía (selectin por defecto) no se usan
+        # para autorizar, así que no se precargan en cada petición.
+        return db.session.get(
+            Usuario,
+            int(user_id),
+            options=[joinedload(Usuario.jerarquia).lazyload(Jerarquia.protocolos)],
+        )
 
     # --- FILTROS DE PLANTILLA (CONVERTIDORES) ---
     @app.template_filter("formato_hora_local")
-    def formato_hora_local(dt, format="%H:%M:%S"):
+    def formato_hora_local(dt, format=_FORMATO_HORA):
         if dt is None:
             return ""
+        return _a_hora_local(dt).strftime(format)
 
-        # 1. Define zona horaria (Ej: 'Europe/Madrid', 'America/Bogota', 'America/Mexico_City')
-        # https://en.wikipedia.org/wiki/List_of_tz_database_time_zones
-        zona_usuario = pytz.timezone("Europe/Madrid")
-
-        # 2. Si la fecha viene sin zona (naive), asumimos que es UTC (estándar en BD)
-        if dt.tzinfo is None:
-            dt = pytz.utc.localize(dt)
-
-        # 3. Convertir a la zona del usuario
-        dt_local = dt.astimezone(zona_usuario)
-        return dt_local.strftime(format)
+    @app.template_filter("formato_fecha_local")
+    def formato_fecha_local(dt):
+        if dt is None:
+            return ""
+        return _a_hora_local(dt).strftime(_FORMATO_FECHA)
 
     # --- CONTEXT PROCESSORS ---
     @app.context_processor
     def inject_permissions():
-        return dict(Permissions=Permissions, Profiles=Profiles)
-
-    # --- SEGURIDAD GLOBAL ---
-    @app.before_request
-    def require_login():
-        if not current_user.is_authenticated:
-            if (
-                request.endpoint
-                and not request.endpoint.startswith("auth.")
-                and not request.endpoint.startswith("static")
-            ):
-                # 'next' guarda la url a la que quería ir, para enviarlo allí después de loguearse
-                return redirect(url_for("auth.login", next=request.url))
+        return _PERM_CTX
 
     # registro de Blueprints
-    from app.routes.index_routes import inicio_bp
-    from app.routes.roles_routes import rol_bp
-    from app.routes.protocolos_routes import protocolo_bp
-    from app.routes.jerarquias_routes import jerarquia_bp
-    from app.routes.juegos_routes import juegos_bp
-    from app.routes.torneos_routes import torneos_bp
-    from app.routes.equipos_routes import equipos_bp
-    from app.routes.usuarios_routes import usuarios_bp
-    from app.routes.registros_routes import registros_bp
-    from app.routes.auth_routes import auth_bp
-
-    app.register_blueprint(inicio_bp)
-    app.register_blueprint(rol_bp)
-    app.register_blueprint(protocolo_bp)
-    app.register_blueprint(jerarquia_bp)
-    app.register_blueprint(juegos_bp)
-    app.register_blueprint(torneos_bp)
-    app.register_blueprint(equipos_bp)
-    app.register_blueprint(usuarios_bp)
-    app.register_blueprint(registros_bp)
-    app.register_blueprint(auth_bp)
+    for module_name, bp_name, url_prefix in _BLUEPRINTS:
+        blueprint = getattr(importlib.import_module(module_name), bp_name)
+        app.register_blueprint(blueprint, url_prefix=url_prefix)
+
+    # --- SEGURIDAD ---
+    # Toda vista fuera de los blueprints públicos exige sesión. El chequeo se
+    # incorpora a la propia vista (login_required) en lugar de un before_request
+    # global, así los estáticos no ejecutan lógica de autenticación.
+    for endpoint, view in list(app.view_functions.items()):
+        blueprint_name, _, _ = endpoint.rpartition(".")
+        if endpoint != "static" and blueprint_name not in _PUBLIC_BLUEPRINTS:
+            app.view_functions[endpoint] = login_required(view)
+
+    # --- COMANDOS CLI ---
+    @app.cli.command("actualizar-marcador")
+    def actualizar_marcador():
+        """Añade y rellena las columnas del marcador de equipos si faltan."""
+        from app.models.equipos_models import Equipo
+
+        columnas = Equipo.agregar_columnas_marcador(db.session)
+        db.session.commit()
+        if columnas:
+            click.echo(f"Columnas añadidas a equipos: {', '.join(columnas)}")
+        else:
+            click.echo("La tabla equipos ya está actualizada.")
+
+    # --- PLANTILLAS ---
+    # En producción se compilan todas al arrancar para que la primera petición
+    # no pague la compilación (sin auto_reload, Jinja no vuelve a hacer stat).
+    if not app.jinja_env.auto_reload:
+        for template_name in app.jinja_env.list_templates():
+            app.jinja_env.get_template(template_name)
 
     return app
@@ -1,8 +1,21 @@
 # --- CONSTANTES DE CONFIGURACIÓN DEL DASHBOARD ---
 # Este archivo centraliza todos los datos estáticos que definen la apariencia
 # y el contenido del panel de control.
+#
+# Los datos se exponen como tuplas de MappingProxyType (solo lectura) para que
+# puedan compartirse entre peticiones sin riesgo de mutaciones accidentales.
+# Quien necesite modificar un ítem debe trabajar sobre una copia (`.copy()`).
 
-METRIC_CARDS = [
+from bisect import bisect_right
+from types import MappingProxyType
+
+
+def _freeze(items):
+    """Convierte una lista de dicts en una tupla de mappings inmutables."""
+    return tuple(MappingProxyType(item) for item in items)
+
+
+METRIC_CARDS = _freeze([
     {
         "label": "NEURAL_SUBJECTS",
         "value": "5",
@@ -38,16 +51,16 @@ METRIC_CARDS = [
         "icon": "sports_esports",
         "color_class": "primary",
     },
-]
+])
 
-MENU_TITLES = [
+MENU_TITLES = _freeze([
     {"name_section": "OPERATIONS_COMMAND"},
     {"name_section": "ARENA_INFRASTRUCTURE"},
     {"name_section": "SYSTEM_KERNEL"},
     {"name_section": "DATA_TELEMETRY"},
-]
+])
 
-MENU_ITEMS = [
+MENU_ITEMS = _freeze([
     # --- SECCIÓN: OPERATIONS_COMMAND ---
     {
         "icon_main": "dashboard",
@@ -132,16 +145,42 @@ MENU_ITEMS = [
         "name_breadcrumbs": "ANALYTICS",
         "min_level": 50,
     },
-]
+])
+
+# Menú precalculado por umbral de acceso: evita filtrar MENU_ITEMS en cada render.
+_MENU_THRESHOLDS = tuple(sorted({item.get("min_level", 0) for item in MENU_ITEMS}))
+
+MENU_BY_LEVEL = MappingProxyType(
+    {
+        threshold: tuple(
+            item for item in MENU_ITEMS if item.get("min_level", 0) <= threshold
+        )
+        for threshold in _MENU_THRESHOLDS
+    }
+)
+
+
+def menu_for(level):
+    """Retorna los ítems del menú accesibles para un nivel de acceso dado.
+
+    Args:
+        level (int): Nivel de acceso del usuario (0-100).
+
+    Returns:
+        tuple: Ítems de MENU_ITEMS con min_level <= level, en orden original.
+    """
+    idx = bisect_right(_MENU_THRESHOLDS, level) - 1
+    return MENU_BY_LEVEL[_MENU_THRESHOLDS[idx]] if idx >= 0 else ()
+
 
-ALERTS_DATA = [
+ALERTS_DATA = _freeze([
     {
         "icon": "fingerprint",
         "title": "[REGISTRO_DE_SUJETOS_ACTIVO]",
         "subtitle": "Indexando firmas neurales en la base de datos central... Acceso concedido.",
         "url_info": "/usuarios",
         "btn_info": "VINCULAR_SUJETO",
-        "access": ["ADMIN", "MOD_SISTEMA", "MOD_TACTICO", "MOD_ARENA", "PARTICIPANTE"],
+        "access": frozenset(["ADMIN", "MOD_SISTEMA", "MOD_TACTICO", "MOD_ARENA", "PARTICIPANTE"]),
     },
     {
         "icon": "account_tree",
@@ -149,7 +188,7 @@ ALERTS_DATA = [
         "subtitle": "Mapeo dinámico de capacidad neural y rangos de mando... Ajustando privilegios de acceso.",
         "url_info": "/jerarquias",
         "btn_info": "INYECTAR_NIVEL_ACCESO",
-        "access": ["ADMIN", "MOD_SISTEMA"],
+        "access": frozenset(["ADMIN", "MOD_SISTEMA"]),
     },
     {
         "icon": "psychology",
@@ -157,7 +196,7 @@ ALERTS_DATA = [
         "subtitle": "Especializaciones de combate codificadas. Cargando modelos de comportamiento de arquetipo.",
         "url_info": "/roles",
         "btn_info": "INYECTAR_PERFIL",
-        "access": ["ADMIN", "MOD_SISTEMA"],
+        "access": frozenset(["ADMIN", "MOD_SISTEMA"]),
     },
     {
         "icon": "terminal",
@@ -165,7 +204,7 @@ ALERTS_DATA = [
         "subtitle": "Definición de reglas críticas y comandos de acceso al Núcleo... Verificando sintaxis del sistema.",
         "url_info": "/protocolos",
         "btn_info": "INYECTAR_COMANDO",
-        "access": ["ADMIN"],
+        "access": frozenset(["ADMIN"]),
     },
     {
         "icon": "extension",
@@ -173,7 +212,7 @@ ALERTS_DATA = [
         "subtitle": "Instalando enclaves neurales de alta densidad. Motores de renderizado de Arena listos.",
         "url_info": "/juegos",
         "btn_info": "INYECTAR_MOTOR",
-        "access": ["ADMIN", "MOD_ARENA"],
+        "access": frozenset(["ADMIN", "MOD_ARENA"]),
     },
     {
         "icon": "military_tech",
@@ -181,7 +220,7 @@ ALERTS_DATA = [
         "subtitle": "Sincronizando simulaciones de combate global... Detectando brechas de competición activas.",
         "url_info": "/torneos",
         "btn_info": "ABRIR_OPERACIÓN",
-        "access": ["ADMIN", "MOD_ARENA"],
+        "access": frozenset(["ADMIN", "MOD_ARENA"]),
     },
     {
         "icon": "groups_3",
@@ -189,7 +228,7 @@ ALERTS_DATA = [
         "subtitle": "Unificación de nodos de combate. Analizando letalidad grupal y sinergia de red local.",
         "url_info": "/equipos",
         "btn_info": "FORJAR_CLUSTER",
-        "access": ["ADMIN", "MOD_TACTICO"],
+        "access": frozenset(["ADMIN", "MOD_TACTICO"]),
     },
     {
         "icon": "History_Edu",
@@ -197,7 +236,7 @@ ALERTS_DATA = [
         "subtitle": "INICIA TU SECUENCIA DE REGISTRO NEURAL. ELIGE TU MODO DE COMBATE E INYÉCTATE EN LA SIMULACIÓN...",
         "url_info": "/registros",
         "btn_info": "TRAZAR_SESIÓN",
-        "access": ["ADMIN"],
+        "access": frozenset(["ADMIN"]),
     },
     {
         "icon": "monitoring",
@@ -205,6 +244,6 @@ ALERTS_DATA = [
         "subtitle": "Cuantificando rendimiento neural post-combate... Generando reportes de eficiencia técnica.",
         "url_info": "/resultados",
         "btn_info": "EXPORTAR_LOGS",
-        "access": ["ADMIN"],
+        "access": frozenset(["ADMIN"]),
     },
-]
+])
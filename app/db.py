@@ -1,9 +1,164 @@
+import sqlite3
+from functools import wraps
+from typing import Optional
+
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import event, func, insert, inspect, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    lazyload,
+    object_session,
+    raiseload,
+    selectinload,
+    with_parent,
+)
+from sqlalchemy.orm.base import NO_VALUE
 
 class Base(DeclarativeBase):
     pass
 
 db = SQLAlchemy(model_class=Base)
 
-session=db.session
\ No newline at end of file
+session=db.session
+
+
+@event.listens_for(Engine, "connect")
+def _activar_claves_foraneas(dbapi_connection, connection_record):
+    """SQLite solo aplica ON DELETE (CASCADE/RESTRICT) con este PRAGMA por conexión."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def safe_len(obj, attr: str) -> Optional[int]:
+    """Tamaño de una relación ya cargada, o None si cargarla requeriría SQL."""
+    valor = inspect(obj).attrs[attr].loaded_value
+    return None if valor is NO_VALUE else len(valor)
+
+
+def contar_relacion(obj, attr: str) -> int:
+    """Cuenta una relación sin materializarla.
+
+    Usa la colección si ya está cargada; si no, emite un COUNT sobre la tabla
+    relacionada. Objetos sin persistir cuentan 0.
+    """
+    cantidad = safe_len(obj, attr)
+    if cantidad is not None:
+        return cantidad
+    sesion = object_session(obj)
+    if sesion is None or inspect(obj).key is None:
+        return 0
+    relacion = getattr(type(obj), attr)
+    destino = relacion.property.mapper.class_
+    return sesion.scalar(
+        select(func.count()).select_from(destino).where(with_parent(obj, relacion))
+    )
+
+
+def repr_len(obj, attr: str) -> str:
+    """Tamaño para __repr__: '?' si la relación no está cargada (sin SQL)."""
+    cantidad = safe_len(obj, attr)
+    return "?" if cantidad is None else str(cantidad)
+
+
+def consulta_listado(consulta, *relaciones, estricto: Optional[bool] = None):
+    """Opciones de carga para endpoints de listado.
+
+    Las `relaciones` declaradas se precargan con `selectinload`; el resto no se
+    carga. En modo estricto (por defecto con `debug`/`testing`) acceder a una
+    relación no declarada lanza un error en vez de emitir una consulta por fila.
+    """
+    if estricto is None:
+        estricto = current_app.debug or current_app.testing
+    opciones = [selectinload(relacion) for relacion in relaciones]
+    opciones.append(raiseload("*") if estricto else lazyload("*"))
+    return consulta.options(*opciones)
+
+
+def dict_cargado(obj, nombres: frozenset) -> dict:
+    """`obj.__dict__` con `nombres` garantizados.
+
+    Permite leer columnas sin pasar por los descriptores del ORM. Las que
+    falten se leen por la vía normal: expiradas o diferidas se cargan, y en
+    objetos sin persistir las generadas por el servidor (ids, fechas) valen
+    None, como con `getattr`.
+    """
+    datos = obj.__dict__
+    faltantes = nombres - datos.keys()
+    if not faltantes:
+        return datos
+    # Un objeto transitorio no guarda en __dict__ los atributos no asignados
+    return {**datos, **{nombre: getattr(obj, nombre) for nombre in faltantes}}
+
+
+def insertar_en_lote(session, modelo, filas: list) -> int:
+    """INSERT masivo de `filas` (dicts) para `modelo` en una sola llamada.
+
+    Usa el bulk INSERT del ORM, que agrupa las filas en sentencias
+    multi-VALUES (insertmanyvalues) en lugar de un INSERT por objeto. No se
+    disparan eventos de mapper ni se crean instancias en la sesión.
+
+    Como no hay instancias, los `@validates` del modelo se aplican aquí a
+    cada fila antes de ejecutar (reciben `self=None`, así que no deben leer
+    otros atributos). Un ValueError aborta el lote sin escribir nada.
+    """
+    if not filas:
+        return 0
+    validadores = inspect(modelo).validators
+    if validadores:
+        filas = [_validar_fila(validadores, fila) for fila in filas]
+    session.execute(insert(modelo), filas)
+    return len(filas)
+
+
+def _validar_fila(validadores, fila: dict) -> dict:
+    """Copia de `fila` con los valores pasados por los validadores del mapper."""
+    fila = dict(fila)
+    for clave, (validador, _opciones) in validadores.items():
+        if clave in fila:
+            fila[clave] = validador(None, clave, fila[clave])
+    return fila
+
+
+_CLAVE_CACHE_INFO = "_info_cache"
+
+
+def info_cacheada(metodo):
+    """Memoiza por instancia la parte de un serializador que sale de la propia fila.
+
+    El método decorado solo debe leer columnas de la instancia y devolver
+    valores inmutables (str, int, bool, None): la caché se invalida con
+    `invalidar_info_cacheada`, que no ve cambios en filas relacionadas, y el
+    llamador recibe una copia superficial. Los datos de otras tablas (nombres
+    de usuario, torneo, jerarquías...) se leen en cada llamada fuera de aquí.
+    """
+
+    @wraps(metodo)
+    def wrapper(self):
+        cache = self.__dict__.get(_CLAVE_CACHE_INFO)
+        if cache is None:
+            cache = self.__dict__[_CLAVE_CACHE_INFO] = metodo(self)
+        return cache.copy()
+
+    return wrapper
+
+
+def invalidar_info_cacheada(modelo, atributos=()):
+    """Descarta la caché de `info_cacheada` cuando cambian sus datos de origen.
+
+    Se invalida al expirar/refrescar la instancia y al asignar cualquiera de
+    `atributos` (las columnas que lee el método cacheado).
+    """
+
+    def _invalidar(target, *args):
+        # "expire" llega con target None si el objeto ya fue recolectado
+        if target is not None:
+            target.__dict__.pop(_CLAVE_CACHE_INFO, None)
+
+    event.listen(modelo, "expire", _invalidar)
+    event.listen(modelo, "refresh", _invalidar)
+    for nombre in atributos:
+        event.listen(getattr(modelo, nombre), "set", _invalidar)
@@ -1,19 +1,20 @@
 import enum
+from typing import NamedTuple
 
 
-class RolUsuario(enum.Enum):
+class RolUsuario(enum.StrEnum):
     administrador = "administrador"
     participante = "participante"
     preparador = "preparador"
 
 
-class TipoTorneo(enum.Enum):
+class TipoTorneo(enum.StrEnum):
     puntos = "puntos"
     tiempo = "tiempo"
     eliminacion = "eliminacion"
 
 
-class EstadoTorneo(enum.Enum):
+class EstadoTorneo(enum.StrEnum):
     draft = "draft"
     open = "open"
     live = "live"
@@ -24,125 +25,173 @@ class EstadoTorneo(enum.Enum):
     # cancelado="cancelado"
 
 
-class EstadoEquipo(enum.Enum):
+class EstadoEquipo(enum.StrEnum):
     pendiente = "pendiente"
     activo = "activo"
     inactivo = "inactivo"
     eliminado = "eliminado"
 
 
-class RolEquipo(enum.Enum):
+class RolEquipo(enum.StrEnum):
     capitan = "capitan"
     miembro = "miembro"
 
 
-class NivelJugador(enum.Enum):
+class NivelJugador(enum.StrEnum):
     amateur = "amateur"
     casual = "casual"
     experto = "experto"
 
 
-class EstadoParticipacion(enum.Enum):
+class EstadoParticipacion(enum.StrEnum):
     activo = "activo"
     eliminado = "eliminado"
 
 
-class EstadoJuego(enum.Enum):
+class EstadoJuego(enum.StrEnum):
     estable = "estable"
     degraded = "degrade"
     beta = "beta"
 
 
-class EspecialidadRol(enum.Enum):
-    frontLine_defense = (
+class _RolMeta(NamedTuple):
+    titulo: str
+    descripcion: str
+    color: str
+
+
+class _ProtocoloMeta(NamedTuple):
+    codigo: str
+    capacidad: str
+
+
+@enum.unique
+class EspecialidadRol(enum.IntEnum):
+    frontLine_defense = 1
+    neural_stealth = 2
+    environment_mastery = 3
+    kinetic_overload = 4
+    data_foresight = 5
+    system_disruption = 6
+    neural_restoration = 7
+    spatial_dislocation = 8
+    temporal_lag_infliction = 9
+    kinetic_absorption = 10
+
+    @property
+    def titulo(self) -> str:
+        return ESPECIALIDAD_META[self].titulo
+
+    @property
+    def descripcion(self) -> str:
+        return ESPECIALIDAD_META[self].descripcion
+
+    @property
+    def color(self) -> str:
+        return ESPECIALIDAD_META[self].color
+
+
+ESPECIALIDAD_META: dict[EspecialidadRol, _RolMeta] = {
+    EspecialidadRol.frontLine_defense: _RolMeta(
         "FRONTLINE_DEFENSE",
         "Resiliencia neural absoluta. Especialista en mitigación de daños y control de presión.",
         "frontLineDefense",
-    )
-    neural_stealth = (
+    ),
+    EspecialidadRol.neural_stealth: _RolMeta(
         "NEURAL_STEALTH",
         "Infiltración profunda. Capaz de evadir escaneos de seguridad y eliminación silenciosa.",
         "neuralStealth",
-    )
-    environment_mastery = (
+    ),
+    EspecialidadRol.environment_mastery: _RolMeta(
         "ENV_MASTERY",
         "Manipulación del entorno táctico y despliegue de estructuras de soporte neural.",
         "environmentMastery",
-    )
-    kinetic_overload = (
+    ),
+    EspecialidadRol.kinetic_overload: _RolMeta(
         "KINETIC_OVERLOAD",
         "Máximo daño cinético. Entra en estado de frenesí sacrificando estabilidad por potencia.",
         "kineticOverload",
-    )
-    data_foresight = (
+    ),
+    EspecialidadRol.data_foresight: _RolMeta(
         "DATA_FORESIGHT",
         "Predicción probabilística. Analiza patrones enemigos antes de que ocurran los ataques.",
         "dataForesight",
-    )
-    system_disruption = (
+    ),
+    EspecialidadRol.system_disruption: _RolMeta(
         "SYSTEM_DISRUPTION",
         "Guerra electrónica. Especialista en quemar terminales y freír enlaces neurales enemigos.",
         "systemDisruption",
-    )
-    neural_restoration = (
+    ),
+    EspecialidadRol.neural_restoration: _RolMeta(
         "NEURAL_RESTORATION",
         "Recuperación acelerada de integridad del sistema y soporte vital.",
         "neuralRestoration",
-    )
-    spatial_dislocation = (
+    ),
+    EspecialidadRol.spatial_dislocation: _RolMeta(
         "SPATIAL_DISLOCATION",
         "Manipulación de coordenadas locales para movimiento no lineal.",
         "spatialDislocation",
-    )
-    temporal_lag_infliction = (
+    ),
+    EspecialidadRol.temporal_lag_infliction: _RolMeta(
         "TEMPORAL_LAG",
         "Inducción de latencia forzada en los procesadores enemigos.",
         "temporalLagInfliction",
-    )
-    kinetic_absorption = (
+    ),
+    EspecialidadRol.kinetic_absorption: _RolMeta(
         "KINETIC_ABSORPTION",
         "Conversión de impacto físico entrante en energía reutilizable.",
         "kineticAbsorption",
-    )
-
-    def __init__(self, titulo, descripcion, color):
-        self.titulo = titulo
-        self.descripcion = descripcion
-        self.color = color
+    ),
+}
 
 
-class CategoriaProtocolo(enum.Enum):
+class CategoriaProtocolo(enum.StrEnum):
     system = "system"
     user = "user"
     arena = "arena"
 
 
-class CodigoProtocolo(enum.Enum):
-    sys_root = (
+@enum.unique
+class CodigoProtocolo(enum.IntEnum):
+    sys_root = 1
+    sys_purge = 2
+    usr_rewrite = 3
+    usr_ban = 4
+    arn_build = 5
+    arn_broadcast = 6
+
+    @property
+    def codigo(self) -> str:
+        return PROTOCOLO_META[self].codigo
+
+    @property
+    def capacidad(self) -> str:
+        return PROTOCOLO_META[self].capacidad
+
+
+PROTOCOLO_META: dict[CodigoProtocolo, _ProtocoloMeta] = {
+    CodigoProtocolo.sys_root: _ProtocoloMeta(
         "SYS_ROOT",
         "Acceso total al núcleo. Permite la reconfiguración de constantes globales del sistema.",
-    )
-    sys_purge = (
+    ),
+    CodigoProtocolo.sys_purge: _ProtocoloMeta(
         "SYS_PURGE",
         "Protocolo de borrado definitivo. Capacidad para eliminar nodos, registros y sujetos permanentemente.",
-    )
-    usr_rewrite = (
+    ),
+    CodigoProtocolo.usr_rewrite: _ProtocoloMeta(
         "USR_REWRITE",
         "Alteración de perfiles neurales. Permite modificar rangos, reputación y datos de identidad.",
-    )
-    usr_ban = (
+    ),
+    CodigoProtocolo.usr_ban: _ProtocoloMeta(
         "USR_BAN",
         "Corte forzado de enlace. Expulsa y bloquea el acceso de cualquier sujeto al mainframe.",
-    )
-    arn_build = (
+    ),
+    CodigoProtocolo.arn_build: _ProtocoloMeta(
         "ARN_BUILD",
         "Creación de nodos de combate. Permite desplegar y gestionar torneos y eventos en vivo.",
-    )
-    arn_broadcast = (
+    ),
+    CodigoProtocolo.arn_broadcast: _ProtocoloMeta(
         "ARN_BROADCAST",
         "Emisión de prioridad absoluta. Envía mensajes y alertas que sobrepasan cualquier interfaz de usuario.",
-    )
-
-    def __init__(self, codigo, capacidad):
-        self.codigo = codigo
-        self.capacidad = capacidad
+    ),
+}
@@ -27,17 +27,39 @@ from sqlalchemy import (
     Table,
     Column,
     CheckConstraint,
+    Index,
+    event,
+    exists,
+    select,
+    delete,
+    insert,
+    case,
+    table,
+    column,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+    relationship,
+    object_session,
+    column_property,
+    selectinload,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import Enum as _Enum
+from sqlalchemy import inspect as sa_inspect, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.hybrid import hybrid_property
 
-from typing import TYPE_CHECKING, List, Optional
+from dataclasses import dataclass
+from functools import wraps
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
-from app.db import Base
+from app.db import Base, repr_len, safe_len
 from app.enums.tipos import EstadoEquipo
+from app.models.usuarios_models import Usuario
 
 if TYPE_CHECKING:
-    from app.models.usuarios_models import Usuario
     from app.models.registros_models import Registro
     from app.models.resultados_models import Resultado
 
@@ -55,9 +77,48 @@ miembros_equipo = Table(
         server_default=func.now(),
         comment="Momento en que el usuario se une al equipo",
     ),
+    # La PK empieza por id_usuario; este índice cubre las búsquedas por equipo
+    Index("ix_miembros_equipo_equipo_usuario", "id_equipo", "id_usuario"),
 )
 
 
+# INSERT con soporte de ON CONFLICT según el dialecto de la sesión
+_INSERT_POR_DIALECTO = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+@dataclass(slots=True, frozen=True)
+class EquipoRow:
+    """Fila ligera y de solo lectura para listados de equipos.
+
+    Evita materializar instancias ORM completas cuando solo se muestran
+    los datos básicos (ver `Equipo.list_rows`).
+    """
+
+    id_equipo: int
+    nombre_equipo: str
+    color_equipo: str
+    estado_equipo: EstadoEquipo
+
+
+def _metrica_cacheada(func):
+    """Memoiza una métrica calculada en `__dict__['_metricas_cache']`.
+
+    La caché vive mientras la instancia no se expire/refresque ni se
+    modifiquen sus colecciones (ver `_invalidar_cache_miembros`).
+    """
+
+    @wraps(func)
+    def wrapper(self):
+        cache = self.__dict__.setdefault("_metricas_cache", {})
+        try:
+            return cache[func.__name__]
+        except KeyError:
+            valor = cache[func.__name__] = func(self)
+            return valor
+
+    return property(wrapper)
+
+
 class Equipo(Base):
     """Modelo principal para un equipo dentro de GameBass."""
 
@@ -67,13 +128,23 @@ class Equipo(Base):
             "length(nombre_equipo) >= 3", name="check_nombre_equipo_minlen"
         ),
         CheckConstraint(
-            "length(color_equipo) = 7 AND color_equipo LIKE " "#%" "",
+            "length(color_equipo) = 7 AND substr(color_equipo, 1, 1) = '#' "
+            "AND ltrim(lower(substr(color_equipo, 2)), '0123456789abcdef') = ''",
             name="check_color_equipo_format",
         ),
         CheckConstraint(
             "maximo_miembros >= 2 AND maximo_miembros <= 100",
             name="check_maximo_miembros_range",
         ),
+        # Listados filtrados por estado y ordenados por fecha de formación
+        Index(
+            "ix_equipos_estado_fecha",
+            "estado_equipo",
+            "fecha_formacion",
+            postgresql_include=["nombre_equipo", "color_equipo"],
+        ),
+        # Equipos de un comandante, opcionalmente filtrados por estado
+        Index("ix_equipos_comandante_estado", "id_comandante", "estado_equipo"),
         {
             "sqlite_autoincrement": True,
             "comment": "Equipos que participan en las competencias",
@@ -121,24 +192,46 @@ class Equipo(Base):
             default=EstadoEquipo.pendiente,
             server_default="pendiente",
         ),
-        index=True,
     )
 
     # --- Clave Foránea (Foreign Key) del líder ---
     id_comandante: Mapped[int] = mapped_column(
         ForeignKey("usuarios.id_usuario", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
         comment="Usuario que comanda/propietario del equipo",
     )
 
+    # --- Marcador desnormalizado ---
+    # Mantenido por los eventos de `Resultado` (ver resultados_models) para que
+    # win_rate no agregue la tabla de resultados en cada listado.
+    partidas: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Resultados registrados del equipo",
+    )
+
+    victorias: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Resultados con posicion_final = 1",
+    )
+
     # --- RELACIONES ---
+    # Many-to-one siempre mostrado junto al equipo: JOIN en la misma consulta.
+    # innerjoin es seguro porque id_comandante es NOT NULL.
     comandante: Mapped["Usuario"] = relationship(
-        "Usuario", back_populates="equipos_comandados"
+        "Usuario", back_populates="equipos_comandados", lazy="joined", innerjoin=True
     )
 
     miembros: Mapped[List["Usuario"]] = relationship(
-        "Usuario", secondary=miembros_equipo, back_populates="membresias"
+        "Usuario",
+        secondary=miembros_equipo,
+        back_populates="membresias",
+        lazy="selectin",
     )
 
     registros: Mapped[List["Registro"]] = relationship(
@@ -149,50 +242,169 @@ class Equipo(Base):
         "Resultado", back_populates="equipo"
     )
 
+    # Caché (no mapeada) de IDs de miembros; se invalida al modificar la
+    # colección o al expirar/refrescar la instancia.
+    _miembro_ids = None
+
     def __repr__(self) -> str:
         """Representación técnica para debugging."""
-        miembros_cnt = len(self.miembros) if self.miembros else 0
         return (
             f"<Equipo(id={self.id_equipo}, "
             f"nombre='{self.nombre_equipo}', "
             f"comandante={self.id_comandante}, "
-            f"miembros={miembros_cnt})>"
+            f"miembros={repr_len(self, 'miembros')})>"
         )
 
     def __str__(self) -> str:
         """Representación amigable para UI."""
         return self.nombre_equipo
 
+    @classmethod
+    def query_with_stats(cls):
+        """Consulta base para listados con miembros y resultados precargados.
+
+        `miembros` ya se carga con selectin por defecto; `resultados` y
+        `registros` siguen siendo lazy y solo se precargan aquí.
+
+        Returns:
+            Select: `select(Equipo)` con las opciones de carga aplicadas.
+        """
+        return select(cls).options(
+            selectinload(cls.miembros), selectinload(cls.resultados)
+        )
+
+    @classmethod
+    def list_rows(cls, session, limit: int = 100) -> List[EquipoRow]:
+        """Lista equipos como `EquipoRow` sin pasar por el mapeo ORM.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            limit (int): Máximo de filas a devolver.
+        Returns:
+            List[EquipoRow]: Filas ordenadas por nombre.
+        """
+        rows = session.execute(
+            select(
+                cls.id_equipo, cls.nombre_equipo, cls.color_equipo, cls.estado_equipo
+            )
+            .order_by(cls.nombre_equipo)
+            .limit(limit)
+        )
+        return [EquipoRow(*row) for row in rows]
+
     # ---------- Propiedades calculadas ----------
 
-    @property
+    @_metrica_cacheada
     def miembros_count(self) -> int:
         """Número de usuarios inscritos en el equipo."""
-        return len(self.miembros) if self.miembros else 0
+        cantidad = safe_len(self, "miembros")
+        return cantidad if cantidad is not None else self.total_miembros or 0
 
-    @property
+    @_metrica_cacheada
     def registros_count(self) -> int:
         """Cantidad de registros de participación."""
-        return len(self.registros) if self.registros else 0
+        cantidad = safe_len(self, "registros")
+        return cantidad if cantidad is not None else self.total_registros or 0
 
-    @property
+    @_metrica_cacheada
     def resultados_count(self) -> int:
         """Cantidad de podios obtenidos por el equipo."""
-        return len(self.resultados) if self.resultados else 0
+        cantidad = safe_len(self, "resultados")
+        return cantidad if cantidad is not None else self.partidas or 0
 
-    @property
+    @hybrid_property
+    def nombre_equipo_upper(self) -> str:
+        """Nombre del equipo en mayúsculas, como se muestra en el dashboard."""
+        return self.nombre_equipo.upper()
+
+    @nombre_equipo_upper.inplace.expression
+    @classmethod
+    def _nombre_equipo_upper_expression(cls):
+        """En consultas se traduce a `upper(nombre_equipo)`."""
+        return func.upper(cls.nombre_equipo)
+
+    @hybrid_property
     def win_rate(self) -> float:
         """Porcentaje de victorias calculado sobre resultados."""
-        total_jugados = len(self.resultados) if self.resultados else 0
+        if "resultados" in self.__dict__:
+            total_jugados = len(self.resultados)
+            victorias = sum(
+                1
+                for resultado in self.resultados
+                if getattr(resultado, "posicion_final", 0) == 1
+            )
+        else:
+            total_jugados = self.partidas or 0
+            victorias = self.victorias or 0
         if total_jugados == 0:
             return 0.0
-        victorias = sum(
-            1
-            for resultado in self.resultados
-            if getattr(resultado, "posicion_final", 0) == 1
-        )
         return round((victorias / total_jugados) * 100, 1)
 
+    @win_rate.inplace.expression
+    @classmethod
+    def _win_rate_expression(cls):
+        """En consultas se calcula con las columnas del marcador, sin JOIN."""
+        return case(
+            (cls.partidas > 0, func.round(100.0 * cls.victorias / cls.partidas, 1)),
+            else_=0.0,
+        )
+
+    @classmethod
+    def recalcular_marcadores(cls, session) -> None:
+        """Recalcula `partidas`/`victorias` de todos los equipos desde resultados.
+
+        Útil tras cargas masivas que no pasan por el ORM o al poblar las
+        columnas en una base de datos existente.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+        """
+        session.execute(
+            cls.__table__.update().values(
+                partidas=select(func.count())
+                .select_from(_resultados)
+                .where(_resultados.c.id_equipo == cls.id_equipo)
+                .scalar_subquery(),
+                victorias=select(func.count())
+                .select_from(_resultados)
+                .where(
+                    _resultados.c.id_equipo == cls.id_equipo,
+                    _resultados.c.posicion_final == 1,
+                )
+                .scalar_subquery(),
+            )
+        )
+
+    @classmethod
+    def agregar_columnas_marcador(cls, session) -> List[str]:
+        """Añade `partidas`/`victorias` a una tabla `equipos` ya existente.
+
+        Paso de actualización para bases creadas antes del marcador (el
+        proyecto no tiene migraciones). Las columnas que falten se crean con
+        DEFAULT 0 y luego se recalculan desde resultados. Si la tabla no
+        existe o ya tiene ambas columnas no hace nada.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+        Returns:
+            List[str]: Nombres de las columnas añadidas.
+        """
+        inspector = sa_inspect(session.connection())
+        if not inspector.has_table(cls.__tablename__):
+            return []
+        existentes = {c["name"] for c in inspector.get_columns(cls.__tablename__)}
+        faltantes = [c for c in ("partidas", "victorias") if c not in existentes]
+        for columna in faltantes:
+            session.execute(
+                text(
+                    f"ALTER TABLE {cls.__tablename__} "
+                    f"ADD COLUMN {columna} INTEGER NOT NULL DEFAULT 0"
+                )
+            )
+        if faltantes:
+            cls.recalcular_marcadores(session)
+        return faltantes
+
     # ---------- Métodos helper / validadores ----------
 
     def es_comandante(self, usuario_id: int) -> bool:
@@ -203,9 +415,9 @@ class Equipo(Base):
         Returns:
             bool: True si coincide con el comandante.
         Raises:
-            TypeError: si usuario_id no es int.
+            TypeError: si usuario_id no es int (solo sin `python -O`).
         """
-        if not isinstance(usuario_id, int):
+        if __debug__ and not isinstance(usuario_id, int):
             raise TypeError(f"usuario_id debe ser int, recibido {type(usuario_id)}")
         return self.id_comandante == usuario_id
 
@@ -217,12 +429,47 @@ class Equipo(Base):
         Returns:
             bool: True si está en la lista de miembros.
         Raises:
-            TypeError: si usuario_id no es int.
+            TypeError: si usuario_id no es int (solo sin `python -O`).
         """
-        if not isinstance(usuario_id, int):
+        if __debug__ and not isinstance(usuario_id, int):
             raise TypeError(f"usuario_id debe ser int, recibido {type(usuario_id)}")
+
+        # Colección ya cargada: lookup en el set cacheado de IDs
+        if "miembros" in self.__dict__:
+            if self._miembro_ids is None:
+                self._miembro_ids = frozenset(u.id_usuario for u in self.miembros)
+            return usuario_id in self._miembro_ids
+
+        # Colección sin cargar: EXISTS sobre la tabla de asociación
+        session = object_session(self)
+        if session is not None and self.id_equipo is not None:
+            return Equipo.exists_member(session, self.id_equipo, usuario_id)
         return any(u.id_usuario == usuario_id for u in self.miembros)
 
+    @classmethod
+    def exists_member(cls, session, id_equipo: int, id_usuario: int) -> bool:
+        """Comprueba la membresía directamente en `miembros_equipo`.
+
+        No materializa la colección `miembros`.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            id_equipo (int): ID del equipo.
+            id_usuario (int): ID del usuario.
+        Returns:
+            bool: True si existe la fila de membresía.
+        """
+        return bool(
+            session.scalar(
+                select(
+                    exists().where(
+                        miembros_equipo.c.id_equipo == id_equipo,
+                        miembros_equipo.c.id_usuario == id_usuario,
+                    )
+                )
+            )
+        )
+
     def agregar_miembro(self, usuario: "Usuario") -> bool:
         """Agrega un usuario al equipo si hay espacio y no está ya.
 
@@ -234,9 +481,7 @@ class Equipo(Base):
             TypeError: si el argumento no es `Usuario`.
             ValueError: si el equipo ya alcanzó su máximo.
         """
-        from app.models.usuarios_models import Usuario as _Usuario
-
-        if not isinstance(usuario, _Usuario):
+        if not isinstance(usuario, Usuario):
             raise TypeError("se requiere una instancia de Usuario")
         if self.es_miembro(usuario.id_usuario):
             return False  # ya está
@@ -255,11 +500,153 @@ class Equipo(Base):
         Raises:
             TypeError: si el argumento no es `Usuario`.
         """
-        from app.models.usuarios_models import Usuario as _Usuario
-
-        if not isinstance(usuario, _Usuario):
+        if not isinstance(usuario, Usuario):
             raise TypeError("se requiere una instancia de Usuario")
+        # InstrumentedList.remove emite el evento de borrado antes de buscar
+        # el elemento, así que se valida la membresía primero.
         if not self.es_miembro(usuario.id_usuario):
             return False
-        self.miembros = [u for u in self.miembros if u.id_usuario != usuario.id_usuario]
+        self.miembros.remove(usuario)
         return True
+
+    @classmethod
+    def bulk_add_members(
+        cls, session, id_equipo: int, id_usuarios: Iterable[int]
+    ) -> int:
+        """Agrega varios miembros con un único INSERT multi-fila.
+
+        Pensado para altas masivas (importaciones, seeds); no materializa la
+        colección `miembros`. Los usuarios que ya son miembros se omiten.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            id_equipo (int): ID del equipo.
+            id_usuarios (Iterable[int]): IDs de los usuarios a añadir.
+        Returns:
+            int: Cantidad de miembros efectivamente añadidos.
+        Raises:
+            ValueError: si el equipo no existe o se supera su máximo.
+        """
+        ids = list(dict.fromkeys(id_usuarios))
+        if not ids:
+            return 0
+
+        maximo = session.scalar(
+            select(cls.maximo_miembros).where(cls.id_equipo == id_equipo)
+        )
+        if maximo is None:
+            raise ValueError(f"Equipo {id_equipo} no existe")
+
+        actuales = set(
+            session.scalars(
+                select(miembros_equipo.c.id_usuario).where(
+                    miembros_equipo.c.id_equipo == id_equipo
+                )
+            )
+        )
+        nuevos = [uid for uid in ids if uid not in actuales]
+        if len(actuales) + len(nuevos) > maximo:
+            raise ValueError("Equipo ya alcanzó su máximo de miembros")
+
+        if nuevos:
+            session.execute(
+                insert(miembros_equipo),
+                [{"id_equipo": id_equipo, "id_usuario": uid} for uid in nuevos],
+            )
+        return len(nuevos)
+
+    @classmethod
+    def add_member_by_id(cls, session, id_equipo: int, id_usuario: int) -> bool:
+        """Inserta una membresía directamente en `miembros_equipo`.
+
+        Contraparte de `remove_member_by_id`: no materializa la colección
+        `miembros` ni valida la capacidad, eso queda a cargo del llamador.
+        Una membresía existente se ignora con `ON CONFLICT DO NOTHING` en
+        SQLite/PostgreSQL.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            id_equipo (int): ID del equipo.
+            id_usuario (int): ID del usuario a añadir.
+        Returns:
+            bool: True si se insertó la fila, False si ya existía.
+        """
+        insert_dialecto = _INSERT_POR_DIALECTO.get(session.get_bind().dialect.name)
+        if insert_dialecto is None:
+            stmt = insert(miembros_equipo)
+        else:
+            stmt = insert_dialecto(miembros_equipo).on_conflict_do_nothing()
+        result = session.execute(
+            stmt.values(id_equipo=id_equipo, id_usuario=id_usuario)
+        )
+        return result.rowcount > 0
+
+    @classmethod
+    def remove_member_by_id(cls, session, id_equipo: int, id_usuario: int) -> bool:
+        """Elimina una membresía directamente en `miembros_equipo`.
+
+        Pensado para cuando solo se conocen los IDs; no materializa la
+        colección `miembros`. Las instancias `Equipo` ya cargadas en la
+        sesión no ven el cambio hasta que se expiran o refrescan.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            id_equipo (int): ID del equipo.
+            id_usuario (int): ID del usuario a remover.
+        Returns:
+            bool: True si se eliminó la fila, False si no existía.
+        """
+        result = session.execute(
+            delete(miembros_equipo).where(
+                miembros_equipo.c.id_equipo == id_equipo,
+                miembros_equipo.c.id_usuario == id_usuario,
+            )
+        )
+        return result.rowcount > 0
+
+
+# --- Agregados SQL (diferidos) ---
+# Subconsultas correlacionadas que cuentan en la base de datos sin cargar las
+# colecciones. Pertenecen al grupo "metricas": al acceder a una se cargan todas
+# en una sola consulta, y en listados se pueden traer junto al SELECT principal
+# con `.options(undefer_group("metricas"))`. Las tablas de registros/resultados
+# se referencian de forma ligera para no importar sus modelos (ciclo).
+# Los resultados no necesitan agregado: ver columnas `partidas`/`victorias`.
+_registros = table("registros", column("id_equipo"))
+_resultados = table("resultados", column("id_equipo"), column("posicion_final"))
+
+Equipo.total_miembros = column_property(
+    select(func.count(miembros_equipo.c.id_usuario))
+    .where(miembros_equipo.c.id_equipo == Equipo.id_equipo)
+    .correlate_except(miembros_equipo)
+    .scalar_subquery(),
+    deferred=True,
+    group="metricas",
+)
+
+Equipo.total_registros = column_property(
+    select(func.count())
+    .select_from(_registros)
+    .where(_registros.c.id_equipo == Equipo.id_equipo)
+    .correlate_except(_registros)
+    .scalar_subquery(),
+    deferred=True,
+    group="metricas",
+)
+
+
+@event.listens_for(Equipo, "expire")
+@event.listens_for(Equipo, "refresh")
+@event.listens_for(Equipo.miembros, "append")
+@event.listens_for(Equipo.miembros, "remove")
+@event.listens_for(Equipo.registros, "append")
+@event.listens_for(Equipo.registros, "remove")
+@event.listens_for(Equipo.resultados, "append")
+@event.listens_for(Equipo.resultados, "remove")
+def _invalidar_cache_miembros(target, *args):
+    """Descarta las cachés de miembros y métricas al recargar o modificar colecciones."""
+    # target es None si el objeto expirado ya fue recolectado
+    if target is None:
+        return
+    target._miembro_ids = None
+    target.__dict__.pop("_metricas_cache", None)
@@ -4,15 +4,32 @@ Define los niveles de autoridad del sistema (0=PARTICIPANTE, 100=ADMIN) y contro
 el acceso a funcionalidades mediante protocolos.
 """
 
-from sqlalchemy import Integer, String, Table, Column, ForeignKey, CheckConstraint
+from sqlalchemy import (
+    Integer,
+    String,
+    Table,
+    Column,
+    ForeignKey,
+    CheckConstraint,
+    Index,
+    event,
+    exists,
+    select,
+    func,
+    literal,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from typing import List, TYPE_CHECKING, Optional
 
-from app.db import Base
+from app.db import Base, contar_relacion, repr_len
+from app.models.usuarios_models import Usuario
 
 if TYPE_CHECKING:
     from app.models.protocolos_models import Protocolo
-    from app.models.usuarios_models import Usuario
+
+# Color usado cuando la jerarquía no tiene uno propio
+_COLOR_POR_DEFECTO = "#A3FF00"
 
 
 jerarquia_protocolo = Table(
@@ -30,6 +47,8 @@ jerarquia_protocolo = Table(
         ForeignKey("protocolos.id_protocolo", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # La PK empieza por id_jerarquia; este índice cubre las búsquedas por protocolo
+    Index("ix_jerarquia_protocolo_protocolo_jerarquia", "id_protocolo", "id_jerarquia"),
 )
 
 
@@ -55,9 +74,13 @@ class Jerarquia(Base):
             "length(nombre_jerarquia) >= 2", name="check_nombre_jerarquia_minlen"
         ),
         CheckConstraint(
-            "color_hex IS NULL OR (length(color_hex) = 7 AND color_hex LIKE " "#%" ")",
+            "color_hex IS NULL OR "
+            "(length(color_hex) = 7 AND substr(color_hex, 1, 1) = '#' "
+            "AND ltrim(lower(substr(color_hex, 2)), '0123456789abcdef') = '')",
             name="check_color_hex_format",
         ),
+        # Listados de jerarquías filtradas/ordenadas por nivel
+        Index("ix_jerarquias_nivel_nombre", "nivel_acceso", "nombre_jerarquia"),
         {
             "sqlite_autoincrement": True,
             "comment": "Niveles de autoridad y control de acceso del sistema",
@@ -76,27 +99,36 @@ class Jerarquia(Base):
         comment="Nombre único visible (ej: 'OMEGA', 'ADMIN')",
     )
 
+    # Textos de detalle: diferidos (grupo "detalles") porque la mayoría de las
+    # consultas (p.ej. la carga del usuario en cada request) solo usan
+    # nombre/nivel/color. Los listados de jerarquías los traen con
+    # `undefer_group("detalles")`.
     subtitulo_jerarquia: Mapped[str] = mapped_column(
-        String(50), nullable=False, comment="Subtítulo temático (ej: 'THE_SINGULARITY')"
+        String(50),
+        nullable=False,
+        deferred=True,
+        deferred_group="detalles",
+        comment="Subtítulo temático (ej: 'THE_SINGULARITY')",
     )
 
     descripcion_jerarquia: Mapped[Optional[str]] = mapped_column(
         String(200),
         nullable=True,
+        deferred=True,
+        deferred_group="detalles",
         comment="Descripción de facultades y responsabilidades",
     )
 
     nivel_acceso: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
-        index=True,
         comment="Valor 0-100 que determina nivel de autoridad",
     )
 
     color_hex: Mapped[Optional[str]] = mapped_column(
         String(7),
         nullable=True,
-        default="#A3FF00",
+        default=_COLOR_POR_DEFECTO,
         comment="Color identificativo en formato #RRGGBB",
     )
 
@@ -106,12 +138,18 @@ class Jerarquia(Base):
     )
 
     protocolos: Mapped[List["Protocolo"]] = relationship(
-        "Protocolo", secondary=jerarquia_protocolo, back_populates="jerarquias"
+        "Protocolo",
+        secondary=jerarquia_protocolo,
+        back_populates="jerarquias",
+        lazy="selectin",
     )
 
+    # Caché (no mapeada) de IDs de protocolos; se invalida al expirar/refrescar.
+    _protocolo_ids = None
+
     def __repr__(self) -> str:
         """Representación técnica para debugging."""
-        usuarios_count = len(self.usuarios) if self.usuarios else 0
+        usuarios_count = repr_len(self, "usuarios")
         return (
             f"<Jerarquia(id={self.id_jerarquia}, "
             f"nombre='{self.nombre_jerarquia}', "
@@ -124,17 +162,98 @@ class Jerarquia(Base):
         return self.nombre_jerarquia
 
     # ---------- Propiedades calculadas ----------
-    @property
+    @hybrid_property
     def color_seguro(self) -> str:
         """Retorna color_hex o default si es None."""
-        return self.color_hex if self.color_hex else "#A3FF00"
+        return self.color_hex or _COLOR_POR_DEFECTO
+
+    @color_seguro.inplace.expression
+    @classmethod
+    def _color_seguro_expression(cls):
+        """En consultas se resuelve en la base de datos con COALESCE."""
+        return func.coalesce(cls.color_hex, literal(_COLOR_POR_DEFECTO))
 
     @property
     def cantidad_usuarios(self) -> int:
         """Cantidad de usuarios con esta jerarquía."""
-        return len(self.usuarios) if self.usuarios else 0
+        return contar_relacion(self, "usuarios")
 
     @property
     def cantidad_protocolos(self) -> int:
         """Cantidad de protocolos asignados."""
-        return len(self.protocolos) if self.protocolos else 0
+        return contar_relacion(self, "protocolos")
+
+    # ---------- Métodos helper ----------
+
+    def puede_acceder_a_protocolo(self, protocolo_id: int) -> bool:
+        """Indica si la jerarquía tiene asignado el protocolo dado.
+
+        Args:
+            protocolo_id (int): ID del protocolo a verificar.
+        Returns:
+            bool: True si el protocolo está asignado.
+        Raises:
+            TypeError: si protocolo_id no es int (solo sin `python -O`).
+        """
+        if __debug__ and not isinstance(protocolo_id, int):
+            raise TypeError(
+                f"protocolo_id debe ser int, recibido {type(protocolo_id)}"
+            )
+        if self._protocolo_ids is None:
+            self._protocolo_ids = frozenset(p.id_protocolo for p in self.protocolos)
+        return protocolo_id in self._protocolo_ids
+
+    @classmethod
+    def has_protocol(cls, session, id_jerarquia: int, id_protocolo: int) -> bool:
+        """Comprueba la asignación directamente en `jerarquia_protocolo`.
+
+        No materializa la colección `protocolos`.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            id_jerarquia (int): ID de la jerarquía.
+            id_protocolo (int): ID del protocolo.
+        Returns:
+            bool: True si existe la fila de asignación.
+        """
+        return bool(
+            session.scalar(
+                select(
+                    exists().where(
+                        jerarquia_protocolo.c.id_jerarquia == id_jerarquia,
+                        jerarquia_protocolo.c.id_protocolo == id_protocolo,
+                    )
+                )
+            )
+        )
+
+    @classmethod
+    def ids_with_min_level(cls, session, min_level: int) -> List[int]:
+        """IDs de los usuarios cuya jerarquía tiene al menos `min_level`.
+
+        El filtro se resuelve en SQL (índice sobre nivel_acceso) en lugar de
+        recorrer usuarios y cargar su jerarquía uno a uno.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            min_level (int): Nivel de acceso mínimo (0-100).
+        Returns:
+            List[int]: IDs de usuario que cumplen el nivel.
+        """
+        return list(
+            session.scalars(
+                select(Usuario.id_usuario)
+                .join(cls, Usuario.id_jerarquia == cls.id_jerarquia)
+                .where(cls.nivel_acceso >= min_level)
+            )
+        )
+
+
+@event.listens_for(Jerarquia, "expire")
+@event.listens_for(Jerarquia, "refresh")
+@event.listens_for(Jerarquia.protocolos, "append")
+@event.listens_for(Jerarquia.protocolos, "remove")
+def _invalidar_cache_protocolos(target, *args):
+    """Descarta la caché de IDs de protocolos al recargar o modificar la colección."""
+    if target is not None:
+        target._protocolo_ids = None
@@ -22,17 +22,46 @@ Ejemplo de uso:
     5
 """
 
-from sqlalchemy import Integer, String, CheckConstraint, Enum as _Enum
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Integer,
+    String,
+    CheckConstraint,
+    Enum as _Enum,
+    column,
+    func,
+    select,
+    table,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    WriteOnlyMapped,
+    mapped_column,
+    relationship,
+    column_property,
+)
 from typing import List, TYPE_CHECKING, Optional
 
-from app.db import Base
+from app.db import (
+    Base,
+    dict_cargado,
+    info_cacheada,
+    insertar_en_lote,
+    invalidar_info_cacheada,
+)
 from app.enums.tipos import EstadoJuego
 
 if TYPE_CHECKING:
     from .torneos_models import Torneo
     from .registros_models import Registro
 
+# Nombre de cada estado, resuelto una sola vez
+_ESTADO_NOMBRES = {estado: estado.name for estado in EstadoJuego}
+
+# Columnas leídas por Juego.obtener_informacion_basica
+_CAMPOS_INFO = frozenset(
+    {"nombre_juego", "motor_juego", "genero_juego", "estado_juego", "color_juego"}
+)
+
 
 class Juego(Base):
     """Representa un juego disponible en el sistema.
@@ -65,7 +94,10 @@ class Juego(Base):
             name='check_genero_juego_minlen'
         ),
         CheckConstraint(
-            'length(color_juego) = 7 AND color_juego LIKE ''#%''',
+            # #RRGGBB: prefijo '#' y 6 dígitos hex (ltrim con juego de
+            # caracteres: portable entre SQLite y PostgreSQL, sin regex)
+            "length(color_juego) = 7 AND substr(color_juego, 1, 1) = '#' "
+            "AND ltrim(lower(substr(color_juego, 2)), '0123456789abcdef') = ''",
             name='check_color_juego_format'
         ),
         {
@@ -121,23 +153,33 @@ class Juego(Base):
     )
 
     # --- RELACIONES ---
+    # Colecciones "write_only": no se cargan como lista; se consultan con
+    # `session.scalars(juego.torneos.select().limit(n))` y se agregan con `.add()`.
+
     # 1:N - Un juego tiene muchos registros (participaciones)
-    registros: Mapped[List["Registro"]] = relationship(
+    registros: WriteOnlyMapped["Registro"] = relationship(
         "Registro",
-        back_populates="juego"
+        back_populates="juego",
+        lazy="write_only",
+        passive_deletes=True
     )
 
-    # 1:N - Un juego puede tener múltiples torneos (cascada: borrar juego → borrar torneos)
-    torneos: Mapped[List["Torneo"]] = relationship(
+    # 1:N - Un juego puede tener múltiples torneos (cascada: borrar juego → borrar torneos).
+    # Con write_only la cascada de borrado no recorre la colección: los torneos
+    # se eliminan explícitamente antes del juego (ver services.delete_game).
+    torneos: WriteOnlyMapped["Torneo"] = relationship(
         "Torneo",
         back_populates="juego",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="write_only",
+        passive_deletes=True
     )
 
     def __repr__(self) -> str:
         """Representación técnica para debugging."""
-        torneos_cnt = len(self.torneos) if self.torneos else 0
-        registros_cnt = len(self.registros) if self.registros else 0
+        # Solo los COUNT ya cargados; el repr no dispara consultas
+        torneos_cnt = self.__dict__.get("total_torneos", "?")
+        registros_cnt = self.__dict__.get("total_registros", "?")
         return (
             f"<Juego(id={self.id_juego}, "
             f"nombre='{self.nombre_juego}', "
@@ -150,22 +192,34 @@ class Juego(Base):
         """Representación amigable para UI."""
         return self.nombre_juego
 
+    @classmethod
+    def bulk_insert(cls, session, rows: List[dict]) -> int:
+        """Inserta muchas filas en lote (seeds, importaciones de catálogo).
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            rows (List[dict]): Valores de columna por fila.
+        Returns:
+            int: Cantidad de filas insertadas.
+        """
+        return insertar_en_lote(session, cls, rows)
+
     # ---------- Propiedades calculadas ----------
 
     @property
     def torneos_count(self) -> int:
-        """Cantidad de torneos asociados a este juego."""
-        return len(self.torneos) if self.torneos else 0
+        """Cantidad de torneos asociados a este juego (COUNT en SQL)."""
+        return self.total_torneos or 0
 
     @property
     def registros_count(self) -> int:
-        """Cantidad de participaciones registradas en este juego."""
-        return len(self.registros) if self.registros else 0
+        """Cantidad de participaciones registradas en este juego (COUNT en SQL)."""
+        return self.total_registros or 0
 
     @property
     def estado_nombre(self) -> str:
         """Nombre legible del estado actual."""
-        return self.estado_juego.name if self.estado_juego else "desconocido"
+        return _ESTADO_NOMBRES.get(self.estado_juego, "desconocido")
 
     # ---------- Métodos helper ----------
 
@@ -184,12 +238,50 @@ class Juego(Base):
             dict: Diccionario con nombre, motor, género, estado.
         """
         return {
-            'nombre': self.nombre_juego,
-            'motor': self.motor_juego,
-            'genero': self.genero_juego,
-            'estado': self.estado_nombre,
-            'color': self.color_juego,
+            **self._info_propia(),
             'torneos': self.torneos_count,
             'participaciones': self.registros_count
         }
 
+    @info_cacheada
+    def _info_propia(self) -> dict:
+        """Campos de `obtener_informacion_basica` que salen de la propia fila."""
+        datos = dict_cargado(self, _CAMPOS_INFO)
+        return {
+            'nombre': datos['nombre_juego'],
+            'motor': datos['motor_juego'],
+            'genero': datos['genero_juego'],
+            'estado': _ESTADO_NOMBRES.get(datos['estado_juego'], "desconocido"),
+            'color': datos['color_juego'],
+        }
+
+
+# --- Agregados SQL (diferidos) ---
+# COUNT correlacionado en la base de datos, sin cargar las colecciones. Grupo
+# "metricas": se cargan juntos al acceder a uno, o en el SELECT principal con
+# `.options(undefer_group("metricas"))`. Tablas ligeras para evitar ciclos.
+_torneos = table("torneos", column("id_juego"))
+_registros = table("registros", column("id_juego"))
+
+Juego.total_torneos = column_property(
+    select(func.count())
+    .select_from(_torneos)
+    .where(_torneos.c.id_juego == Juego.id_juego)
+    .correlate_except(_torneos)
+    .scalar_subquery(),
+    deferred=True,
+    group="metricas",
+)
+
+Juego.total_registros = column_property(
+    select(func.count())
+    .select_from(_registros)
+    .where(_registros.c.id_juego == Juego.id_juego)
+    .correlate_except(_registros)
+    .scalar_subquery(),
+    deferred=True,
+    group="metricas",
+)
+
+
+invalidar_info_cacheada(Juego, atributos=_CAMPOS_INFO)
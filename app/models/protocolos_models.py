@@ -25,15 +25,52 @@ Ejemplo:
     >>> session.commit()
 """
 
-from sqlalchemy import Integer, String, Enum as _Enum, CheckConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import (
+    Integer,
+    String,
+    Enum as _Enum,
+    CheckConstraint,
+    column,
+    func,
+    select,
+    table,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    WriteOnlyMapped,
+    mapped_column,
+    relationship,
+    column_property,
+    object_session,
+)
+from typing import List, Optional
 
-from app.db import Base
+from app.db import (
+    Base,
+    dict_cargado,
+    info_cacheada,
+    insertar_en_lote,
+    invalidar_info_cacheada,
+)
 from app.enums.tipos import CategoriaProtocolo, CodigoProtocolo
+from app.models.jerarquias_models import Jerarquia
 
-if TYPE_CHECKING:
-    from app.models.jerarquias_models import Jerarquia
+# Categorías que requieren privilegios críticos (ver Protocolo.es_critico)
+_CATEGORIAS_CRITICAS = frozenset({CategoriaProtocolo.system})
+
+# Nombre de cada categoría, resuelto una sola vez
+_CATEGORIA_NOMBRES = {categoria: categoria.name for categoria in CategoriaProtocolo}
+
+# Columnas leídas por Protocolo.obtener_informacion_basica
+_CAMPOS_INFO = frozenset(
+    {
+        "id_protocolo",
+        "codigo_protocolo",
+        "nombre_protocolo",
+        "categoria_protocolo",
+        "descripcion_protocolo",
+    }
+)
 
 
 class Protocolo(Base):
@@ -114,11 +151,14 @@ class Protocolo(Base):
     )
     
     # ===== Relaciones (M:N con Jerarquia) =====
-    jerarquias: Mapped[List["Jerarquia"]] = relationship(
+    # "write_only": se consulta con `protocolo.jerarquias.select()`, nunca como lista
+    jerarquias: WriteOnlyMapped["Jerarquia"] = relationship(
         "Jerarquia",
         secondary="jerarquia_protocolo",
         back_populates="protocolos",
-        lazy="select"
+        lazy="write_only",
+        # Las filas de jerarquia_protocolo se borran por ON DELETE CASCADE
+        passive_deletes=True
     )
     
     def __repr__(self) -> str:
@@ -128,45 +168,71 @@ class Protocolo(Base):
             f"codigo={self.codigo_protocolo.name}, "
             f"nombre='{self.nombre_protocolo}', "
             f"categoria={self.categoria_protocolo.name}, "
-            f"jerarquias={len(self.jerarquias)})>"
+            f"jerarquias={self.__dict__.get('total_jerarquias', '?')})>"
         )
     
     def __str__(self) -> str:
         """Representación amigable para UI."""
         return f"[{self.codigo_protocolo.name}] {self.nombre_protocolo}"
     
+    @classmethod
+    def bulk_insert(cls, session, rows: List[dict]) -> int:
+        """Inserta muchas filas en lote (seeds, importaciones de protocolos).
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            rows (List[dict]): Valores de columna por fila.
+        Returns:
+            int: Cantidad de filas insertadas.
+        """
+        return insertar_en_lote(session, cls, rows)
+
     @property
     def es_critico(self) -> bool:
         """¿Este protocolo requiere privilegios críticos?
         
-        Retorna True si es nivel ADMIN o superior.
+        Retorna True si la categoría es de sistema.
         """
-        return self.categoria_protocolo in [
-            CategoriaProtocolo.admin,
-            CategoriaProtocolo.system
-        ]
+        return self.categoria_protocolo in _CATEGORIAS_CRITICAS
     
     @property
     def jerarquias_count(self) -> int:
         """¿Cuántas jerarquías (roles) tienen este protocolo?"""
-        return len(self.jerarquias) if self.jerarquias else 0
+        return self.total_jerarquias or 0
     
     @property
     def categoria_nombre(self) -> str:
         """Nombre legible de la categoría."""
-        return self.categoria_protocolo.name
+        return _CATEGORIA_NOMBRES[self.categoria_protocolo]
     
     def obtener_informacion_basica(self) -> dict:
         """Retorna información del protocolo para UI/API."""
+        info = self._info_propia()
+        session = object_session(self)
+        jerarquias = (
+            session.scalars(
+                self.jerarquias.select().with_only_columns(Jerarquia.nombre_jerarquia)
+            ).all()
+            if session is not None and info['id'] is not None
+            else []
+        )
+        return {
+            **info,
+            'jerarquias_asignadas': len(jerarquias),
+            'jerarquias': list(jerarquias)
+        }
+
+    @info_cacheada
+    def _info_propia(self) -> dict:
+        """Campos de `obtener_informacion_basica` que salen de la propia fila."""
+        datos = dict_cargado(self, _CAMPOS_INFO)
         return {
-            'id': self.id_protocolo,
-            'codigo': self.codigo_protocolo.name,
-            'nombre': self.nombre_protocolo,
-            'categoria': self.categoria_nombre,
-            'descripcion': self.descripcion_protocolo,
-            'es_critico': self.es_critico,
-            'jerarquias_asignadas': self.jerarquias_count,
-            'jerarquias': [j.nombre_jerarquia for j in self.jerarquias] if self.jerarquias else []
+            'id': datos['id_protocolo'],
+            'codigo': datos['codigo_protocolo'].name,
+            'nombre': datos['nombre_protocolo'],
+            'categoria': _CATEGORIA_NOMBRES[datos['categoria_protocolo']],
+            'descripcion': datos['descripcion_protocolo'],
+            'es_critico': datos['categoria_protocolo'] in _CATEGORIAS_CRITICAS,
         }
     
     def puede_ser_usado_por_jerarquia(self, jerarquia_id: int) -> bool:
@@ -178,4 +244,41 @@ class Protocolo(Base):
         Returns:
             True si la jerarquía tiene asignado este protocolo
         """
-        return any(j.id_jerarquia == jerarquia_id for j in self.jerarquias)
+        # EXISTS sobre la tabla de asociación; un protocolo sin persistir no
+        # tiene asignaciones en la base de datos
+        session = object_session(self)
+        if session is None or self.id_protocolo is None:
+            return False
+        return Protocolo.puede_ser_usado_por(session, self.id_protocolo, jerarquia_id)
+
+    @classmethod
+    def puede_ser_usado_por(
+        cls, session, protocolo_id: int, jerarquia_id: int
+    ) -> bool:
+        """Comprueba la asignación con un EXISTS, sin cargar `jerarquias`.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            protocolo_id (int): ID del protocolo.
+            jerarquia_id (int): ID de la jerarquía.
+        Returns:
+            bool: True si la jerarquía tiene asignado el protocolo.
+        """
+        return Jerarquia.has_protocol(session, jerarquia_id, protocolo_id)
+
+
+# --- Agregado SQL (diferido) ---
+# COUNT correlacionado sobre la tabla de asociación, sin cargar `jerarquias`.
+_jerarquia_protocolo = table("jerarquia_protocolo", column("id_protocolo"))
+
+Protocolo.total_jerarquias = column_property(
+    select(func.count())
+    .select_from(_jerarquia_protocolo)
+    .where(_jerarquia_protocolo.c.id_protocolo == Protocolo.id_protocolo)
+    .correlate_except(_jerarquia_protocolo)
+    .scalar_subquery(),
+    deferred=True,
+)
+
+
+invalidar_info_cacheada(Protocolo, atributos=_CAMPOS_INFO)
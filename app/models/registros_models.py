@@ -26,11 +26,30 @@ Ejemplo de uso:
     >>> session.commit()
 """
 
-from sqlalchemy import Integer, String, DateTime, func, ForeignKey, CheckConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from typing import TYPE_CHECKING, Optional
-
-from app.db import Base
+from datetime import datetime
+
+from sqlalchemy import (
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    CheckConstraint,
+    Index,
+    case,
+    select,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship, joinedload
+from sqlalchemy.ext.hybrid import hybrid_property
+from typing import TYPE_CHECKING, List, Optional
+
+from app.db import (
+    Base,
+    dict_cargado,
+    info_cacheada,
+    insertar_en_lote,
+    invalidar_info_cacheada,
+)
 
 if TYPE_CHECKING:
     from .torneos_models import Torneo
@@ -39,6 +58,12 @@ if TYPE_CHECKING:
     from .equipos_models import Equipo
     from .roles_models import Rol
 
+# Puntaje máximo admitido (ver check_puntaje_range)
+_PUNTAJE_MAXIMO = 10000
+
+# Columnas leídas por Registro.obtener_informacion_basica
+_CAMPOS_INFO = frozenset({"id_registro", "puntaje", "fecha_registro", "id_equipo"})
+
 
 class Registro(Base):
     """Registro de participación de usuario en un torneo.
@@ -65,9 +90,21 @@ class Registro(Base):
             'puntaje >= 0 AND puntaje <= 10000',
             name='check_puntaje_range'
         ),
-        CheckConstraint(
-            '(id_equipo IS NOT NULL) OR (id_equipo IS NULL)',
-            name='check_equipo_opcional'
+        # Ranking por torneo dentro de un juego
+        Index('ix_registros_juego_torneo_puntaje', 'id_juego', 'id_torneo', 'puntaje'),
+        # Historial de participaciones de un usuario
+        Index(
+            'ix_registros_usuario_fecha',
+            'id_usuario',
+            'fecha_registro',
+            postgresql_include=['puntaje'],
+        ),
+        # Solo participaciones en equipo (id_equipo NULL = modo individual)
+        Index(
+            'ix_registros_equipo_notnull',
+            'id_equipo',
+            postgresql_where=text('id_equipo IS NOT NULL'),
+            sqlite_where=text('id_equipo IS NOT NULL'),
         ),
         {
             "sqlite_autoincrement": True,
@@ -88,9 +125,10 @@ class Registro(Base):
         comment="Puntuación obtenida (0-10000, específico del juego)"
     )
 
-    fecha_registro: Mapped[DateTime] = mapped_column(
+    fecha_registro: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        server_default=func.now(),
+        # CURRENT_TIMESTAMP es palabra clave SQL, no llamada a función
+        server_default=text("CURRENT_TIMESTAMP"),
         comment="Timestamp automático de participación"
     )
 
@@ -106,14 +144,12 @@ class Registro(Base):
     id_juego: Mapped[int] = mapped_column(
         ForeignKey("juegos.id_juego", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
         comment="Juego que se jugó"
     )
 
     id_usuario: Mapped[int] = mapped_column(
         ForeignKey("usuarios.id_usuario", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
         comment="Usuario participante"
     )
 
@@ -127,7 +163,6 @@ class Registro(Base):
     id_equipo: Mapped[Optional[int]] = mapped_column(
         ForeignKey("equipos.id_equipo", ondelete="RESTRICT"),
         nullable=True,
-        index=True,
         comment="Equipo (opcional si es competencia individual)"
     )
 
@@ -175,6 +210,37 @@ class Registro(Base):
         equipo_info = f" ({self.equipo.nombre_equipo})" if self.equipo else " (individual)"
         return f"{self.usuario.alias_usuario}{equipo_info}"
 
+    @classmethod
+    def query_with_relations(cls):
+        """Consulta base con todas las relaciones many-to-one precargadas.
+
+        Usuario, torneo, juego, rol y equipo llegan en el mismo SELECT (JOIN),
+        de modo que recorrer N registros y llamar a `obtener_informacion_basica`
+        no dispara 5 consultas por fila.
+
+        Returns:
+            Select: `select(Registro)` con las opciones de carga aplicadas.
+        """
+        return select(cls).options(
+            joinedload(cls.usuario),
+            joinedload(cls.torneo),
+            joinedload(cls.juego),
+            joinedload(cls.rol),
+            joinedload(cls.equipo),
+        )
+
+    @classmethod
+    def bulk_insert(cls, session, rows: List[dict]) -> int:
+        """Inserta muchas filas en lote (seeds, importaciones de telemetría).
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            rows (List[dict]): Valores de columna por fila.
+        Returns:
+            int: Cantidad de filas insertadas.
+        """
+        return insertar_en_lote(session, cls, rows)
+
     # ---------- Propiedades calculadas ----------
 
     @property
@@ -187,6 +253,22 @@ class Registro(Base):
         """¿Esta participación fue en equipo?"""
         return self.id_equipo is not None
 
+    @hybrid_property
+    def puntaje_norm(self) -> float:
+        """Puntaje como porcentaje (0-100) sobre el máximo admitido."""
+        return min(100.0, max(0.0, (self.puntaje or 0) * 100.0 / _PUNTAJE_MAXIMO))
+
+    @puntaje_norm.inplace.expression
+    @classmethod
+    def _puntaje_norm_expression(cls):
+        """En consultas la base de datos calcula el porcentaje (ORDER BY, AVG...)."""
+        porcentaje = cls.puntaje * 100.0 / _PUNTAJE_MAXIMO
+        return case(
+            (porcentaje > 100.0, 100.0),
+            (porcentaje < 0.0, 0.0),
+            else_=porcentaje,
+        )
+
     # ---------- Métodos helper ----------
 
     def obtener_informacion_basica(self) -> dict:
@@ -195,19 +277,31 @@ class Registro(Base):
         Returns:
             dict: Información de participación con entidades relacionadas.
         """
+        usuario, torneo, juego, rol, equipo = (
+            self.usuario, self.torneo, self.juego, self.rol, self.equipo
+        )
+        return {
+            **self._info_propia(),
+            'usuario': usuario.alias_usuario if usuario else "Desconocido",
+            'torneo': torneo.nombre_torneo if torneo else "Desconocido",
+            'juego': juego.nombre_juego if juego else "Desconocido",
+            'rol': rol.nombre_rol if rol else "Desconocido",
+            'equipo': equipo.nombre_equipo if equipo else "Individual",
+        }
+
+    @info_cacheada
+    def _info_propia(self) -> dict:
+        """Campos de `obtener_informacion_basica` que salen de la propia fila."""
+        datos = dict_cargado(self, _CAMPOS_INFO)
+        fecha = datos['fecha_registro']
         return {
-            'id': self.id_registro,
-            'usuario': self.usuario.alias_usuario if self.usuario else "Desconocido",
-            'torneo': self.torneo.nombre_torneo if self.torneo else "Desconocido",
-            'juego': self.juego.nombre_juego if self.juego else "Desconocido",
-            'rol': self.rol.nombre_rol if self.rol else "Desconocido",
-            'equipo': self.equipo.nombre_equipo if self.equipo else "Individual",
-            'puntaje': self.puntaje,
-            'fecha': self.fecha_registro.isoformat() if self.fecha_registro else None,
-            'modo': 'Equipo' if self.es_en_equipo else 'Individual'
+            'id': datos['id_registro'],
+            'puntaje': datos['puntaje'],
+            'fecha': fecha.isoformat() if fecha else None,
+            'modo': 'Individual' if datos['id_equipo'] is None else 'Equipo'
         }
 
-    def obtener_puntaje_normalizado(self, max_puntaje: int = 10000) -> float:
+    def obtener_puntaje_normalizado(self, max_puntaje: int = _PUNTAJE_MAXIMO) -> float:
         """Retorna puntaje como porcentaje (0-100).
 
         Args:
@@ -221,6 +315,10 @@ class Registro(Base):
         """
         if max_puntaje <= 0:
             raise ValueError("max_puntaje debe ser mayor que 0")
+        if max_puntaje == _PUNTAJE_MAXIMO:
+            return self.puntaje_norm
         porcentaje = (self.puntaje / max_puntaje) * 100
         return min(100.0, max(0.0, porcentaje))
 
+
+invalidar_info_cacheada(Registro, atributos=_CAMPOS_INFO)
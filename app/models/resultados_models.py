@@ -27,16 +27,42 @@ Ejemplo:
     >>> session.commit()
 """
 
-from sqlalchemy import Integer, Boolean, String, ForeignKey, CheckConstraint
+from collections import Counter
+
+from sqlalchemy import (
+    Integer,
+    Boolean,
+    String,
+    ForeignKey,
+    CheckConstraint,
+    Index,
+    event,
+    insert,
+    select,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from typing import TYPE_CHECKING, Optional
+from sqlalchemy.orm.attributes import get_history
+from typing import List, Optional
+
+from app.db import Base, dict_cargado, info_cacheada, invalidar_info_cacheada
+from app.models.equipos_models import Equipo
+from app.models.torneos_models import Torneo
+from app.models.usuarios_models import Usuario
+
+# Columnas leídas por Resultado.obtener_informacion_basica
+_CAMPOS_INFO = frozenset({
+    "id_resultado", "posicion_final", "puntaje_total",
+    "victoria_confirmada", "recompensa_entregada", "id_equipo",
+})
 
-from app.db import Base
+# Medallas del podio; del 4° lugar en adelante se formatea la posición
+_MEDALLAS = {1: "🥇 Oro", 2: "🥈 Plata", 3: "🥉 Bronce"}
 
-if TYPE_CHECKING:
-    from app.models.torneos_models import Torneo
-    from app.models.usuarios_models import Usuario
-    from app.models.equipos_models import Equipo
+
+def _medalla_de(posicion: int) -> str:
+    """Medalla correspondiente a una posición final."""
+    return _MEDALLAS.get(posicion) or f"4to+ ({posicion}°)"
 
 
 class Resultado(Base):
@@ -62,6 +88,23 @@ class Resultado(Base):
     __table_args__ = (
         CheckConstraint('posicion_final >= 1', name='check_posicion_final_minimo'),
         CheckConstraint('puntaje_total >= 0', name='check_puntaje_total_no_negativo'),
+        # Podio de un torneo ordenado por posición (index-only en PostgreSQL)
+        Index(
+            'ix_resultados_torneo_posicion',
+            'id_torneo',
+            'posicion_final',
+            postgresql_include=['puntaje_total', 'id_usuario'],
+        ),
+        # Un resultado por usuario y torneo; también sirve al historial del usuario
+        Index('ix_resultados_usuario_torneo', 'id_usuario', 'id_torneo', unique=True),
+        # Ganadores confirmados: solo indexa las pocas filas con victoria
+        Index(
+            'ix_resultados_confirmed_winners',
+            'id_torneo',
+            'posicion_final',
+            postgresql_where=text('victoria_confirmada = true'),
+            sqlite_where=text('victoria_confirmada = 1'),
+        ),
         {
             "sqlite_autoincrement": True,
             "comment": "Podios y rankings: usuario + torneo + posición + puntaje total"
@@ -97,14 +140,12 @@ class Resultado(Base):
     id_torneo: Mapped[Optional[int]] = mapped_column(
         ForeignKey('torneos.id_torneo', ondelete="RESTRICT"),
         nullable=True,
-        index=True,
         comment="Torneo en el que obtuvo este resultado"
     )
     
     id_usuario: Mapped[int] = mapped_column(
         ForeignKey('usuarios.id_usuario', ondelete="RESTRICT"),
         nullable=False,
-        index=True,
         comment="Usuario ganador (RESTRICT: preservar historia)"
     )
     
@@ -116,31 +157,48 @@ class Resultado(Base):
     )
     
     # ===== Relaciones =====
+    # Many-to-one con carga "joined": obtener_informacion_basica y __str__ las
+    # leen siempre, así que llegan en el mismo SELECT del resultado.
     torneo: Mapped[Optional["Torneo"]] = relationship(
         "Torneo",
-        back_populates="resultados"
+        back_populates="resultados",
+        lazy="joined"
     )
     
+    # INNER JOIN: id_usuario es NOT NULL
     usuario: Mapped["Usuario"] = relationship(
         "Usuario",
-        back_populates="resultados"
+        back_populates="resultados",
+        lazy="joined",
+        innerjoin=True
     )
     
     equipo: Mapped[Optional["Equipo"]] = relationship(
         "Equipo",
-        back_populates="resultados"
+        back_populates="resultados",
+        lazy="joined"
     )
     
+    # Caché (no mapeada) de la medalla; se invalida al cambiar posicion_final
+    # o al expirar/refrescar la instancia.
+    _medalla = None
+
     def __repr__(self) -> str:
         """Representación técnica para debugging."""
-        equipo_str = f", equipo={self.id_equipo}" if self.id_equipo else ""
-        medalla = self.obtener_medalla()
+        # Solo estado ya cargado: en una instancia expirada no dispara SELECT
+        datos = self.__dict__
+        id_equipo = datos.get("id_equipo")
+        equipo_str = f", equipo={id_equipo}" if id_equipo else ""
+        if "posicion_final" in datos:
+            posicion = f"{datos['posicion_final']} ({self.obtener_medalla()})"
+        else:
+            posicion = "?"
         return (
-            f"<Resultado(id={self.id_resultado}, "
-            f"usuario={self.id_usuario}, "
-            f"torneo={self.id_torneo}, "
-            f"posicion={self.posicion_final} ({medalla}), "
-            f"puntaje={self.puntaje_total}{equipo_str})>"
+            f"<Resultado(id={datos.get('id_resultado', '?')}, "
+            f"usuario={datos.get('id_usuario', '?')}, "
+            f"torneo={datos.get('id_torneo', '?')}, "
+            f"posicion={posicion}, "
+            f"puntaje={datos.get('puntaje_total', '?')}{equipo_str})>"
         )
     
     def __str__(self) -> str:
@@ -149,6 +207,94 @@ class Resultado(Base):
         equipo_info = f" ({self.equipo.nombre_equipo})" if self.equipo else ""
         return f"#{self.posicion_final} {medalla} - {self.usuario.alias_usuario}{equipo_info}"
     
+    @classmethod
+    def bulk_insert(
+        cls, session, rows: List[dict], batch_size: int = 10_000
+    ) -> List[int]:
+        """Inserta resultados en lotes (p. ej. al cerrar un torneo).
+
+        Cada lote es un INSERT ... RETURNING multi-fila. El bulk INSERT no
+        dispara los eventos de mapper, así que el marcador de los equipos se
+        ajusta aquí con un UPDATE por equipo. No hace commit: todo queda en
+        la transacción del llamador.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            rows (List[dict]): Valores de columna por fila.
+            batch_size (int): Filas por sentencia INSERT.
+        Returns:
+            List[int]: IDs generados, en el orden de `rows`.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size debe ser mayor que 0")
+        ids: List[int] = []
+        sentencia = insert(cls).returning(cls.id_resultado, sort_by_parameter_order=True)
+        for inicio in range(0, len(rows), batch_size):
+            ids.extend(session.scalars(sentencia, rows[inicio:inicio + batch_size]))
+
+        partidas, victorias = Counter(), Counter()
+        for fila in rows:
+            id_equipo = fila.get("id_equipo")
+            if id_equipo is not None:
+                partidas[id_equipo] += 1
+                victorias[id_equipo] += fila.get("posicion_final") == 1
+        conexion = session.connection()
+        for id_equipo, cantidad in partidas.items():
+            _sumar_marcador(conexion, id_equipo, cantidad, victorias[id_equipo])
+        return ids
+
+    @classmethod
+    def leaderboard(cls, session, id_torneo: int, limit: int = 100) -> List[dict]:
+        """Podio de un torneo como dicts, sin instanciar objetos ORM.
+
+        Una sola consulta por columnas (usuario, torneo y equipo vía JOIN)
+        ordenada por posición; usa `ix_resultados_torneo_posicion`. Cada dict
+        tiene la forma de `obtener_informacion_basica`.
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            id_torneo (int): Torneo a consultar.
+            limit (int): Máximo de posiciones a devolver.
+        Returns:
+            List[dict]: Resultados ordenados por posición final.
+        """
+        filas = session.execute(
+            select(
+                cls.id_resultado,
+                cls.posicion_final,
+                cls.puntaje_total,
+                cls.victoria_confirmada,
+                cls.recompensa_entregada,
+                cls.id_equipo,
+                Usuario.alias_usuario,
+                Torneo.nombre_torneo,
+                Equipo.nombre_equipo,
+            )
+            .join(Usuario, cls.id_usuario == Usuario.id_usuario)
+            .join(Torneo, cls.id_torneo == Torneo.id_torneo)
+            .outerjoin(Equipo, cls.id_equipo == Equipo.id_equipo)
+            .where(cls.id_torneo == id_torneo)
+            .order_by(cls.posicion_final)
+            .limit(limit)
+        )
+        return [
+            {
+                'id': fila.id_resultado,
+                'usuario': fila.alias_usuario,
+                'torneo': fila.nombre_torneo,
+                'posicion': fila.posicion_final,
+                'medalla': _medalla_de(fila.posicion_final),
+                'puntaje': fila.puntaje_total,
+                'equipo': fila.nombre_equipo or "Individual",
+                'modo': "Equipo" if fila.id_equipo else "Individual",
+                'victoria_confirmada': fila.victoria_confirmada,
+                'recompensa': fila.recompensa_entregada,
+                'es_podio': fila.posicion_final <= 3,
+                'es_ganador': fila.posicion_final == 1
+            }
+            for fila in filas
+        ]
+
     @property
     def es_podio(self) -> bool:
         """¿Está en los principales 3 lugares?"""
@@ -166,28 +312,94 @@ class Resultado(Base):
     
     def obtener_medalla(self) -> str:
         """Retorna la medalla correspondiente a la posición."""
-        if self.posicion_final == 1:
-            return "🥇 Oro"
-        elif self.posicion_final == 2:
-            return "🥈 Plata"
-        elif self.posicion_final == 3:
-            return "🥉 Bronce"
-        else:
-            return f"4to+ ({self.posicion_final}°)"
+        if self._medalla is None:
+            self._medalla = _medalla_de(self.posicion_final)
+        return self._medalla
     
     def obtener_informacion_basica(self) -> dict:
         """Retorna información del resultado para UI/reportes."""
+        usuario, torneo, equipo = self.usuario, self.torneo, self.equipo
+        return {
+            **self._info_propia(),
+            'usuario': usuario.alias_usuario if usuario else "Desconocido",
+            'torneo': torneo.nombre_torneo if torneo else "Desconocido",
+            'equipo': equipo.nombre_equipo if equipo else "Individual",
+        }
+    
+    @info_cacheada
+    def _info_propia(self) -> dict:
+        """Campos de `obtener_informacion_basica` que salen de la propia fila."""
+        datos = dict_cargado(self, _CAMPOS_INFO)
+        posicion = datos['posicion_final']
         return {
-            'id': self.id_resultado,
-            'usuario': self.usuario.alias_usuario if self.usuario else "Desconocido",
-            'torneo': self.torneo.nombre_torneo if self.torneo else "Desconocido",
-            'posicion': self.posicion_final,
+            'id': datos['id_resultado'],
+            'posicion': posicion,
             'medalla': self.obtener_medalla(),
-            'puntaje': self.puntaje_total,
-            'equipo': self.equipo.nombre_equipo if self.equipo else "Individual",
-            'modo': self.modo,
-            'victoria_confirmada': self.victoria_confirmada,
-            'recompensa': self.recompensa_entregada,
-            'es_podio': self.es_podio,
-            'es_ganador': self.es_ganador
+            'puntaje': datos['puntaje_total'],
+            'modo': "Equipo" if datos['id_equipo'] else "Individual",
+            'victoria_confirmada': datos['victoria_confirmada'],
+            'recompensa': datos['recompensa_entregada'],
+            'es_podio': posicion <= 3,
+            'es_ganador': posicion == 1
         }
+
+
+@event.listens_for(Resultado, "expire")
+@event.listens_for(Resultado, "refresh")
+@event.listens_for(Resultado.posicion_final, "set")
+def _invalidar_cache_medalla(target, *args):
+    """Descarta la medalla cacheada al recargar o cambiar la posición."""
+    if target is not None:
+        target._medalla = None
+
+
+invalidar_info_cacheada(Resultado, atributos=_CAMPOS_INFO)
+
+
+# ===== Marcador desnormalizado de Equipo =====
+# Mantiene Equipo.partidas / Equipo.victorias sincronizados con cada flush.
+# Las operaciones masivas (bulk/Core) no disparan estos eventos: en ese caso
+# usar Equipo.recalcular_marcadores(session) (Resultado.bulk_insert ya ajusta).
+
+def _sumar_marcador(connection, id_equipo, partidas, victorias):
+    """Suma `partidas`/`victorias` (pueden ser negativas) al marcador del equipo."""
+    connection.execute(
+        Equipo.__table__.update()
+        .where(Equipo.__table__.c.id_equipo == id_equipo)
+        .values(
+            partidas=Equipo.__table__.c.partidas + partidas,
+            victorias=Equipo.__table__.c.victorias + victorias,
+        )
+    )
+
+
+def _ajustar_marcador(connection, id_equipo, posicion_final, signo):
+    """Suma (signo=1) o resta (signo=-1) un resultado al marcador del equipo."""
+    if id_equipo is None:
+        return
+    victoria = signo if posicion_final == 1 else 0
+    _sumar_marcador(connection, id_equipo, signo, victoria)
+
+
+@event.listens_for(Resultado, "after_insert")
+def _resultado_insertado(mapper, connection, target):
+    _ajustar_marcador(connection, target.id_equipo, target.posicion_final, 1)
+
+
+@event.listens_for(Resultado, "after_delete")
+def _resultado_eliminado(mapper, connection, target):
+    _ajustar_marcador(connection, target.id_equipo, target.posicion_final, -1)
+
+
+@event.listens_for(Resultado, "after_update")
+def _resultado_actualizado(mapper, connection, target):
+    # Los resultados no deberían editarse, pero si cambia el equipo o la
+    # posición se mueve el resultado entre marcadores.
+    hist_equipo = get_history(target, "id_equipo")
+    hist_posicion = get_history(target, "posicion_final")
+    if not (hist_equipo.has_changes() or hist_posicion.has_changes()):
+        return
+    equipo_previo = (hist_equipo.deleted or [target.id_equipo])[0]
+    posicion_previa = (hist_posicion.deleted or [target.posicion_final])[0]
+    _ajustar_marcador(connection, equipo_previo, posicion_previa, -1)
+    _ajustar_marcador(connection, target.id_equipo, target.posicion_final, 1)
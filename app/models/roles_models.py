@@ -21,16 +21,20 @@ Ejemplo de uso:
 
 from typing import List, TYPE_CHECKING, Optional
 
-from sqlalchemy import Integer, String, CheckConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from sqlalchemy import Enum as _Enum
 
-from app.db import Base
+from app.db import Base, contar_relacion, insertar_en_lote, repr_len
 from app.enums.tipos import EspecialidadRol
 
 if TYPE_CHECKING:
     from app.models.registros_models import Registro
 
+# Longitudes mínimas (validadas en el ORM, sin CHECK por fila en la BD)
+_MIN_NOMBRE = 3
+_MIN_DESCRIPCION = 5
+
 
 class Rol(Base):
     """Representa un arquetipo de jugador con especialidad única.
@@ -48,14 +52,6 @@ class Rol(Base):
     __tablename__ = "roles"
 
     __table_args__ = (
-        CheckConstraint(
-            'length(nombre_rol) >= 3',
-            name='check_nombre_rol_minlen'
-        ),
-        CheckConstraint(
-            'descripcion_rol IS NULL OR length(descripcion_rol) >= 5',
-            name='check_descripcion_rol_minlen'
-        ),
         {
             "sqlite_autoincrement": True,
             "comment": "Arquetipos y especialidades de jugadores en la arena"
@@ -104,11 +100,14 @@ class Rol(Base):
 
     def __repr__(self) -> str:
         """Representación técnica para debugging."""
-        registros_cnt = len(self.registros) if self.registros else 0
+        # Solo estado ya cargado: en una instancia expirada no dispara SELECT
+        datos = self.__dict__
+        especialidad = datos.get("especialidad_rol")
+        registros_cnt = repr_len(self, "registros")
         return (
-            f"<Rol(id={self.id_rol}, "
-            f"nombre='{self.nombre_rol}', "
-            f"especialidad='{self.especialidad_rol.name}', "
+            f"<Rol(id={datos.get('id_rol', '?')}, "
+            f"nombre='{datos.get('nombre_rol', '?')}', "
+            f"especialidad='{especialidad.name if especialidad is not None else '?'}', "
             f"registros={registros_cnt})>"
         )
 
@@ -116,12 +115,40 @@ class Rol(Base):
         """Representación amigable para UI."""
         return self.nombre_rol
 
+    @classmethod
+    def bulk_insert(cls, session, rows: List[dict]) -> int:
+        """Inserta muchas filas en lote (seeds de roles).
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            rows (List[dict]): Valores de columna por fila.
+        Returns:
+            int: Cantidad de filas insertadas.
+        """
+        return insertar_en_lote(session, cls, rows)
+
+    @validates("nombre_rol")
+    def _validar_nombre(self, clave: str, valor: str) -> str:
+        """Exige al menos 3 caracteres en el nombre."""
+        if valor is not None and len(valor) < _MIN_NOMBRE:
+            raise ValueError(f"nombre_rol debe tener al menos {_MIN_NOMBRE} caracteres")
+        return valor
+
+    @validates("descripcion_rol")
+    def _validar_descripcion(self, clave: str, valor: Optional[str]) -> Optional[str]:
+        """Exige al menos 5 caracteres en la descripción, si se indica."""
+        if valor is not None and len(valor) < _MIN_DESCRIPCION:
+            raise ValueError(
+                f"descripcion_rol debe tener al menos {_MIN_DESCRIPCION} caracteres"
+            )
+        return valor
+
     # ---------- Propiedades calculadas ----------
 
     @property
     def registros_count(self) -> int:
         """Cantidad de veces que este rol ha sido utilizado."""
-        return len(self.registros) if self.registros else 0
+        return contar_relacion(self, "registros")
 
     @property
     def especialidad_nombre(self) -> str:
@@ -27,11 +27,29 @@ Ejemplo de uso:
     8
 """
 
-from sqlalchemy import Integer, String, DateTime, func, ForeignKey, CheckConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Integer,
+    String,
+    DateTime,
+    func,
+    ForeignKey,
+    CheckConstraint,
+    Index,
+    column,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+    relationship,
+    column_property,
+    validates,
+)
 from typing import TYPE_CHECKING, List, Optional
 
-from app.db import Base
+from app.db import Base, insertar_en_lote, repr_len, safe_len
 from app.enums.tipos import EstadoTorneo
 from sqlalchemy import Enum as _Enum
 
@@ -40,6 +58,9 @@ if TYPE_CHECKING:
     from .registros_models import Registro
     from .resultados_models import Resultado
 
+# Longitud mínima de nombre_torneo (ver Torneo._validar_nombre)
+_MIN_NOMBRE = 3
+
 
 class Torneo(Base):
     """Representa un campeonato o competencia en GameBass.
@@ -61,14 +82,6 @@ class Torneo(Base):
     __tablename__ = "torneos"
 
     __table_args__ = (
-        CheckConstraint(
-            'length(nombre_torneo) >= 3',
-            name='check_nombre_torneo_minlen'
-        ),
-        CheckConstraint(
-            'length(recompensa_torneo) >= 1',
-            name='check_recompensa_torneo_minlen'
-        ),
         CheckConstraint(
             'nivel_acceso_min >= 0 AND nivel_acceso_min <= 100',
             name='check_nivel_acceso_min_range'
@@ -81,12 +94,23 @@ class Torneo(Base):
             'fecha_inicio IS NULL OR fecha_fin IS NULL OR fecha_inicio < fecha_fin',
             name='check_fechas_coherente'
         ),
+        # Torneos en curso por juego (pocas filas frente al histórico)
+        Index(
+            'ix_torneos_activos',
+            'id_juego',
+            postgresql_where=text(f"estado_torneo = '{EstadoTorneo.live.name}'"),
+            sqlite_where=text(f"estado_torneo = '{EstadoTorneo.live.name}'"),
+        ),
         {
             "sqlite_autoincrement": True,
             "comment": "Campeonatos y competencias organizadas por juego"
         },
     )
 
+    # fecha_creacion (server_default) no se pide con RETURNING en cada INSERT;
+    # queda expirada y se lee al acceder a ella.
+    __mapper_args__ = {"eager_defaults": False}
+
     id_torneo: Mapped[int] = mapped_column(
         Integer,
         primary_key=True,
@@ -160,6 +184,10 @@ class Torneo(Base):
     )
 
     # --- RELACIONES ---
+    # Colecciones 1:N perezosas: los conteos salen de las columnas diferidas
+    # "metricas". Los listados que recorran las filas las precargan con
+    # `selectinload` en la consulta (ver `consulta_listado`).
+
     # 1:N - Un torneo tiene muchos registros (participaciones)
     registros: Mapped[List["Registro"]] = relationship(
         "Registro",
@@ -181,13 +209,16 @@ class Torneo(Base):
 
     def __repr__(self) -> str:
         """Representación técnica para debugging."""
-        registros_cnt = len(self.registros) if self.registros else 0
-        resultados_cnt = len(self.resultados) if self.resultados else 0
+        # Solo estado ya cargado: en una instancia expirada no dispara SELECT
+        datos = self.__dict__
+        estado = datos.get("estado_torneo")
+        registros_cnt = repr_len(self, "registros")
+        resultados_cnt = repr_len(self, "resultados")
         return (
-            f"<Torneo(id={self.id_torneo}, "
-            f"nombre='{self.nombre_torneo}', "
-            f"estado='{self.estado_torneo.name}', "
-            f"juego={self.id_juego}, "
+            f"<Torneo(id={datos.get('id_torneo', '?')}, "
+            f"nombre='{datos.get('nombre_torneo', '?')}', "
+            f"estado='{estado.name if estado is not None else '?'}', "
+            f"juego={datos.get('id_juego', '?')}, "
             f"registros={registros_cnt}, "
             f"resultados={resultados_cnt})>"
         )
@@ -196,17 +227,45 @@ class Torneo(Base):
         """Representación amigable para UI."""
         return self.nombre_torneo
 
+    @classmethod
+    def bulk_insert(cls, session, rows: List[dict]) -> int:
+        """Inserta muchas filas en lote (seeds, importaciones de torneos).
+
+        Args:
+            session: Sesión SQLAlchemy activa.
+            rows (List[dict]): Valores de columna por fila.
+        Returns:
+            int: Cantidad de filas insertadas.
+        """
+        return insertar_en_lote(session, cls, rows)
+
+    @validates("nombre_torneo")
+    def _validar_nombre(self, clave: str, valor: str) -> str:
+        """Exige al menos 3 caracteres en el nombre."""
+        if valor is not None and len(valor) < _MIN_NOMBRE:
+            raise ValueError(f"nombre_torneo debe tener al menos {_MIN_NOMBRE} caracteres")
+        return valor
+
+    @validates("recompensa_torneo")
+    def _validar_recompensa(self, clave: str, valor: str) -> str:
+        """La recompensa no puede ser una cadena vacía."""
+        if valor is not None and not valor:
+            raise ValueError("recompensa_torneo no puede estar vacía")
+        return valor
+
     # ---------- Propiedades calculadas ----------
 
     @property
     def registros_count(self) -> int:
         """Cantidad actual de participantes registrados."""
-        return len(self.registros) if self.registros else 0
+        cantidad = safe_len(self, "registros")
+        return cantidad if cantidad is not None else (self.total_registros or 0)
 
     @property
     def resultados_count(self) -> int:
         """Cantidad de podios/resultados registrados."""
-        return len(self.resultados) if self.resultados else 0
+        cantidad = safe_len(self, "resultados")
+        return cantidad if cantidad is not None else (self.total_resultados or 0)
 
     @property
     def capacidad_disponible(self) -> int:
@@ -235,9 +294,9 @@ class Torneo(Base):
             bool: True si el usuario cumple con el nivel mínimo requerido.
 
         Raises:
-            TypeError: Si nivel_acceso_usuario no es int.
+            TypeError: Si nivel_acceso_usuario no es int (solo sin `python -O`).
         """
-        if not isinstance(nivel_acceso_usuario, int):
+        if __debug__ and not isinstance(nivel_acceso_usuario, int):
             raise TypeError(
                 f"nivel_acceso_usuario debe ser int, recibido {type(nivel_acceso_usuario)}"
             )
@@ -271,3 +330,30 @@ class Torneo(Base):
             'fecha_fin': self.fecha_fin.isoformat() if self.fecha_fin else None
         }
 
+
+# --- Agregados SQL (diferidos) ---
+# COUNT correlacionado en la base de datos para cuando las colecciones no se
+# cargan (p. ej. con `lazyload`/`noload`). Grupo "metricas": se traen en el
+# SELECT principal con `.options(undefer_group("metricas"))`.
+_registros = table("registros", column("id_torneo"))
+_resultados = table("resultados", column("id_torneo"))
+
+Torneo.total_registros = column_property(
+    select(func.count())
+    .select_from(_registros)
+    .where(_registros.c.id_torneo == Torneo.id_torneo)
+    .correlate_except(_registros)
+    .scalar_subquery(),
+    deferred=True,
+    group="metricas",
+)
+
+Torneo.total_resultados = column_property(
+    select(func.count())
+    .select_from(_resultados)
+    .where(_resultados.c.id_torneo == Torneo.id_torneo)
+    .correlate_except(_resultados)
+    .scalar_subquery(),
+    deferred=True,
+    group="metricas",
+)
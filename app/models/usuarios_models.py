@@ -4,12 +4,24 @@ Define usuarios con credenciales seguras, jerarquías de permisos, y relaciones
 con equipos, torneos y resultados.
 """
 
-from sqlalchemy import Integer, String, DateTime, ForeignKey, CheckConstraint, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    CheckConstraint,
+    column,
+    exists,
+    func,
+    select,
+    table,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
 from flask_login import UserMixin
 from typing import List, TYPE_CHECKING, Optional
 
-from app.db import Base
+from app.db import Base, contar_relacion
 
 if TYPE_CHECKING:
     from app.models.jerarquias_models import Jerarquia
@@ -17,6 +29,23 @@ if TYPE_CHECKING:
     from app.models.registros_models import Registro
     from app.models.resultados_models import Resultado
 
+# Tablas ligeras para los COUNT/EXISTS en SQL (evitan importar los modelos
+# relacionados, que a su vez importan Usuario).
+_equipos = table("equipos", column("id_equipo"), column("id_comandante"))
+_miembros_equipo = table("miembros_equipo", column("id_equipo"), column("id_usuario"))
+_resultados = table("resultados", column("id_usuario"))
+
+
+def _contar_por_usuario(tabla, columna, id_usuario):
+    """COUNT correlacionado de filas de `tabla` con `columna` == `id_usuario`."""
+    return (
+        select(func.count())
+        .select_from(tabla)
+        .where(columna == id_usuario)
+        .correlate_except(tabla)
+        .scalar_subquery()
+    )
+
 
 class Usuario(Base, UserMixin):
     """Representa un usuario autenticado del sistema.
@@ -38,7 +67,7 @@ class Usuario(Base, UserMixin):
             name='check_alias_usuario_minlen'
         ),
         CheckConstraint(
-            'email_usuario LIKE ''%@%''',
+            "email_usuario LIKE '%@%'",
             name='check_email_usuario_format'
         ),
         CheckConstraint(
@@ -139,20 +168,41 @@ class Usuario(Base, UserMixin):
         """Representación amigable para UI."""
         return self.alias_usuario
 
-    @property
+    # Los conteos son híbridos: en la instancia usan la colección cargada o un
+    # COUNT; en consultas (`select(Usuario.equipos_count)`, `order_by`) son
+    # subconsultas correlacionadas.
+
+    @hybrid_property
     def equipos_count(self) -> int:
         """Cantidad de equipos que comanda."""
-        return len(self.equipos_comandados) if self.equipos_comandados else 0
+        return contar_relacion(self, "equipos_comandados")
+
+    @equipos_count.inplace.expression
+    @classmethod
+    def _equipos_count_expression(cls):
+        return _contar_por_usuario(_equipos, _equipos.c.id_comandante, cls.id_usuario)
 
-    @property
+    @hybrid_property
     def membresias_count(self) -> int:
         """Retorna la cantidad de equipos en los que el usuario es miembro."""
-        return len(self.membresias) if self.membresias else 0
+        return contar_relacion(self, "membresias")
 
-    @property
+    @membresias_count.inplace.expression
+    @classmethod
+    def _membresias_count_expression(cls):
+        return _contar_por_usuario(
+            _miembros_equipo, _miembros_equipo.c.id_usuario, cls.id_usuario
+        )
+
+    @hybrid_property
     def resultados_count(self) -> int:
         """Retorna la cantidad de resultados (podios) obtenidos por el usuario."""
-        return len(self.resultados) if self.resultados else 0
+        return contar_relacion(self, "resultados")
+
+    @resultados_count.inplace.expression
+    @classmethod
+    def _resultados_count_expression(cls):
+        return _contar_por_usuario(_resultados, _resultados.c.id_usuario, cls.id_usuario)
 
     def get_id(self) -> str:
         """Retorna ID como string para Flask-Login."""
@@ -168,10 +218,25 @@ class Usuario(Base, UserMixin):
             bool: True si lo comanda.
         
         Raises:
-            TypeError: Si equipo_id no es int.
+            TypeError: Si equipo_id no es int (solo sin `python -O`).
         """
-        if not isinstance(equipo_id, int):
+        if __debug__ and not isinstance(equipo_id, int):
             raise TypeError(f"equipo_id debe ser int, recibido {type(equipo_id)}")
+        # Colección ya cargada: respuesta en Python sin SQL
+        if "equipos_comandados" in self.__dict__:
+            return any(e.id_equipo == equipo_id for e in self.equipos_comandados)
+
+        # Sin cargar: EXISTS sobre equipos
+        session = object_session(self)
+        if session is not None and self.id_usuario is not None:
+            return session.scalar(
+                select(
+                    exists().where(
+                        _equipos.c.id_comandante == self.id_usuario,
+                        _equipos.c.id_equipo == equipo_id,
+                    )
+                )
+            )
         return any(e.id_equipo == equipo_id for e in self.equipos_comandados)
 
     def es_miembro_equipo(self, equipo_id: int) -> bool:
@@ -184,10 +249,25 @@ class Usuario(Base, UserMixin):
             bool: True si es miembro.
         
         Raises:
-            TypeError: Si equipo_id no es int.
+            TypeError: Si equipo_id no es int (solo sin `python -O`).
         """
-        if not isinstance(equipo_id, int):
+        if __debug__ and not isinstance(equipo_id, int):
             raise TypeError(f"equipo_id debe ser int, recibido {type(equipo_id)}")
+        # Colección ya cargada: respuesta en Python sin SQL
+        if "membresias" in self.__dict__:
+            return any(e.id_equipo == equipo_id for e in self.membresias)
+
+        # Sin cargar: EXISTS sobre la tabla de asociación
+        session = object_session(self)
+        if session is not None and self.id_usuario is not None:
+            return session.scalar(
+                select(
+                    exists().where(
+                        _miembros_equipo.c.id_usuario == self.id_usuario,
+                        _miembros_equipo.c.id_equipo == equipo_id,
+                    )
+                )
+            )
         return any(e.id_equipo == equipo_id for e in self.membresias)
 
     def obtener_nivel_acceso(self) -> int:
@@ -3,7 +3,14 @@ from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import check_password_hash
 from app.services import usuarios_services
 
-auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
+auth_bp = Blueprint("auth", __name__)
+
+# Destino tras el login según el nivel de acceso (umbral, endpoint), de mayor a menor
+_DESTINOS_POR_NIVEL = (
+    (80, "index.index"),  # Alto Mando / Admin -> Dashboard Principal
+    (50, "equipo.index"),  # Comandantes -> Gestión de Equipos
+)
+_DESTINO_POR_DEFECTO = "torneo.index"  # Soldados / Usuarios Base -> Torneos
 
 
 @auth_bp.route("/login", methods=["GET", "POST"])
@@ -36,14 +43,12 @@ def login():
             return redirect(next_page)
 
         # 2. Si no, decidimos su destino según su RANGO (Nivel de Acceso)
-        nivel = user.jerarquia.nivel_acceso
-
-        if nivel >= 80:  # Alto Mando / Admin -> Dashboard Principal
-            return redirect(url_for("index.index"))
-        elif nivel >= 50:  # Comandantes -> Gestión de Equipos
-            return redirect(url_for("equipo.index"))
-        else:  # Soldados / Usuarios Base -> Torneos (o su perfil si existiera ruta)
-            return redirect(url_for("torneo.index"))
+        nivel = user.jerarquia.nivel_acceso or 0
+        destino = next(
+            (endpoint for umbral, endpoint in _DESTINOS_POR_NIVEL if nivel >= umbral),
+            _DESTINO_POR_DEFECTO,
+        )
+        return redirect(url_for(destino))
 
     return render_template("auth/login.html")
 
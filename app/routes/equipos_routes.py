@@ -7,7 +7,6 @@ from flask import (
     flash,
     current_app,
 )
-import math
 
 from flask_login import login_required
 
@@ -16,7 +15,7 @@ from app.services import dashboard_service, equipos_services, usuarios_services
 from app.utils.decorators import permission_required
 from app.utils.permissions import Profiles
 
-equipos_bp = Blueprint("equipo", __name__, url_prefix="/equipos")
+equipos_bp = Blueprint("equipo", __name__)
 
 
 @equipos_bp.route("/")
@@ -67,12 +66,7 @@ def create():
 @equipos_bp.route("/update/<int:id_equipo>", methods=["POST"])
 @permission_required(*Profiles.TACTICO)
 def update(id_equipo):
-
-    equipo = equipos_services.get_equipos_by_id(id_equipo)
-
-    if not equipo:
-        raise ValueError(f"El equipo con ID {id_equipo} no existe.")
-
+    # update_equipo carga el equipo y lanza ValueError si no existe
     nombre_equipo = request.form.get("nombre_equipo")
     lema_equipo = request.form.get("lema_equipo")
     maximo_miembros = request.form.get("maximo_miembros")
@@ -105,7 +99,7 @@ def delete(id_equipo):
 @equipos_bp.route("/<int:id_equipo>/manage")
 def manage_members(id_equipo):
     context = dashboard_service.get_dashboard_data(request.path)
-    equipo = equipos_services.get_equipos_by_id(id_equipo)
+    equipo = equipos_services.get_equipo_with_members(id_equipo)
 
     if not equipo:
         # Manejar el caso de que el equipo no exista
@@ -113,25 +107,23 @@ def manage_members(id_equipo):
 
     # Sobrescribimos el contexto genérico con datos específicos para esta página.
     # Esto asegura que el título y el breadcrumb en el layout principal sean correctos.
-    context["page_title"] = f"MANAGE: {equipo.nombre_equipo.upper()}"
-    context["page_data"] = f"SQUAD_ROSTER / {equipo.nombre_equipo.upper()}"
+    nombre = equipo.nombre_equipo_upper
+    context["page_title"] = f"MANAGE: {nombre}"
+    context["page_data"] = f"SQUAD_ROSTER / {nombre}"
 
     # --- LÓGICA DE PAGINACIÓN ---
     # 1. Obtener el número de página de la URL (por defecto 1)
     page = request.args.get("page", 1, type=int)
     per_page = 5  # Cantidad fija de usuarios por página
 
-    # 2. Identificar a quiénes excluir (los que ya son miembros)
-    member_ids = {miembro.id_usuario for miembro in equipo.miembros}
-
-    # 3. Pedir al servicio los usuarios paginados
-    available_users, total_users = usuarios_services.get_available_users_paginated(
-        member_ids, page, per_page
+    # 2. Pedir al servicio los usuarios paginados, excluyendo en SQL a los que
+    #    ya son miembros del equipo, junto con el total de páginas
+    available_users, total_users, total_pages = (
+        usuarios_services.get_available_users_paginated(
+            equipo.id_equipo, page, per_page
+        )
     )
 
-    # 4. Calcular el total de páginas
-    total_pages = math.ceil(total_users / per_page)
-
     return render_template(
         "dashboard/manage_equipo.html",
         equipo=equipo,
@@ -4,7 +4,7 @@ from app.services import jerarquias_services, protocolos_services, dashboard_ser
 from app.utils.decorators import permission_required
 from app.utils.permissions import Profiles
 
-jerarquia_bp = Blueprint("jerarquia", __name__, url_prefix="/jerarquias")
+jerarquia_bp = Blueprint("jerarquia", __name__)
 
 
 @jerarquia_bp.route("/", strict_slashes=False)
@@ -42,12 +42,10 @@ def create():
 
     # Obtenemos la LISTA de IDs de los protocolos que seleccionamos
     protocolos_ids = request.form.getlist("protocolos_ids")
-    protocolos = [
-        protocolos_services.get_protocolo_by_id(pid) for pid in protocolos_ids
-    ]
+    protocolos = protocolos_services.get_protocolos_by_ids(protocolos_ids)
 
     jerarquias_services.create_jerarquia(
-        nombre, subtitulo, descripcion, nivel, protocolos, color
+        nombre, subtitulo, descripcion, nivel, color=color, protocolos=protocolos
     )
 
     return redirect(url_for("jerarquia.index"))
@@ -66,9 +64,7 @@ def update(id_jerarquia):
     color = request.form.get("color_jerarquia")
 
     # 1. Convertimos los IDs de los protocolos en los objetos que la BD espera (igual que en 'create')
-    protocolos = [
-        protocolos_services.get_protocolo_by_id(pid) for pid in protocolos_ids
-    ]
+    protocolos = protocolos_services.get_protocolos_by_ids(protocolos_ids)
 
     # 2. ¡AQUÍ ESTÁ EL ARREGLO! Pasamos 'descripcion' y 'nivel' en el orden correcto.
     jerarquias_services.update_jerarquia(
@@ -5,7 +5,7 @@ from app.services import dashboard_service, juegos_services
 from app.utils.decorators import permission_required
 from app.utils.permissions import Profiles
 
-juegos_bp = Blueprint("juego", __name__, url_prefix="/juegos")
+juegos_bp = Blueprint("juego", __name__)
 
 
 @juegos_bp.route("/")
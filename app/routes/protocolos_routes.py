@@ -5,7 +5,7 @@ from app.services import protocolos_services, dashboard_service
 from app.utils.decorators import permission_required
 from app.utils.permissions import Profiles
 
-protocolo_bp = Blueprint("protocolo", __name__, url_prefix="/protocolos")
+protocolo_bp = Blueprint("protocolo", __name__)
 
 
 @protocolo_bp.route("", strict_slashes=False)
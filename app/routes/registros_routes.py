@@ -8,7 +8,7 @@ from app.services import (
 )
 from flask_login import current_user
 
-registros_bp = Blueprint("registro", __name__, url_prefix="/registros")
+registros_bp = Blueprint("registro", __name__)
 
 
 @registros_bp.route("/")
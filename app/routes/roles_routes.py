@@ -15,7 +15,7 @@ from app.services import dashboard_service
 from app.utils.decorators import permission_required
 from app.utils.permissions import Permissions, Profiles
 
-rol_bp = Blueprint("rol", __name__, url_prefix="/roles")
+rol_bp = Blueprint("rol", __name__)
 
 
 @rol_bp.route("", strict_slashes=False)
@@ -3,7 +3,7 @@ from flask import Blueprint, request, render_template, redirect, url_for, flash
 from app.enums.tipos import EstadoTorneo
 from app.services import dashboard_service, torneos_services, juegos_services
 
-torneos_bp = Blueprint("torneo", __name__, url_prefix="/torneos")
+torneos_bp = Blueprint("torneo", __name__)
 
 
 @torneos_bp.route("/")
@@ -15,7 +15,7 @@ from app.services import dashboard_service, usuarios_services, jerarquias_servic
 from app.utils.decorators import permission_required
 from app.utils.permissions import Permissions
 
-usuarios_bp = Blueprint("usuario", __name__, url_prefix="/usuarios")
+usuarios_bp = Blueprint("usuario", __name__)
 
 
 @usuarios_bp.route("/")
@@ -8,7 +8,7 @@ Maneja la lógica de agregación de datos para el dashboard, incluyendo:
 """
 
 from typing import Optional, Dict, List, Any, Tuple
-from flask import current_app
+from flask import current_app, g
 from flask_login import current_user
 from itertools import groupby
 from operator import itemgetter
@@ -49,6 +49,17 @@ def _normalize_path(path: str) -> str:
     return path.rstrip("/") if len(path) > 1 else path
 
 
+# Índice ruta normalizada -> (alerta, niveles permitidos), calculado una sola vez.
+# Se recorre en orden inverso para que, ante rutas repetidas, gane la primera alerta.
+_ALERTS_BY_PATH: Dict[str, Tuple[Any, frozenset]] = {
+    _normalize_path(alert.get("url_info", "")): (
+        alert,
+        frozenset(getattr(Permissions, role, -1) for role in alert.get("access", ())),
+    )
+    for alert in reversed(config.ALERTS_DATA)
+}
+
+
 def _get_filtered_menu(user_level: int) -> List[Dict[str, Any]]:
     """Filtra los ítems del menú según el nivel de acceso del usuario.
 
@@ -64,11 +75,8 @@ def _get_filtered_menu(user_level: int) -> List[Dict[str, Any]]:
     if not isinstance(user_level, int):
         raise TypeError(f"user_level debe ser int, recibido {type(user_level)}")
 
-    return [
-        item.copy()
-        for item in config.MENU_ITEMS
-        if user_level >= item.get("min_level", 0)
-    ]
+    # Copias: _mark_active_menu_and_get_page_info marca el ítem activo
+    return [item.copy() for item in config.menu_for(user_level)]
 
 
 def _group_menu_by_section(
@@ -117,31 +125,17 @@ def _get_active_alert(normalized_path: str) -> Optional[Dict[str, Any]]:
         )
         return None
 
-    user_level = _calculate_access_level(current_user)
-
-    try:
-        found_alert = next(
-            (
-                alert
-                for alert in config.ALERTS_DATA
-                if _normalize_path(alert.get("url_info", "")) == normalized_path
-            ),
-            None,
-        )
-
-        if found_alert:
-            alert_copy = found_alert.copy()
-            allowed_levels = [
-                getattr(Permissions, role, -1) for role in found_alert.get("access", [])
-            ]
-            alert_copy["user_has_access"] = user_level in allowed_levels
-            return alert_copy
-
-        return None
-    except (KeyError, TypeError) as e:
-        current_app.logger.exception(f"Error obteniendo alerta activa: {e}")
+    entry = _ALERTS_BY_PATH.get(normalized_path)
+    if entry is None:
         return None
 
+    found_alert, allowed_levels = entry
+    alert_copy = found_alert.copy()
+    alert_copy["user_has_access"] = (
+        _calculate_access_level(current_user) in allowed_levels
+    )
+    return alert_copy
+
 
 def show_actions_crud(current_user):
     user_level = _calculate_access_level(current_user)
@@ -265,6 +259,24 @@ def get_dashboard_data(current_path: str) -> Dict[str, Any]:
         current_app.logger.warning("current_path vacío, usando '/'")
         current_path = "/"
 
+    # Memo por request: el contexto solo depende del usuario y la ruta
+    key = (getattr(current_user, "id_usuario", None), current_path)
+    cache = g.setdefault("_dashboard_data", {})
+    if key not in cache:
+        cache[key] = _build_dashboard_data(current_path)
+    # Copia superficial: las rutas sobrescriben claves como page_title
+    return dict(cache[key])
+
+
+def _build_dashboard_data(current_path: str) -> Dict[str, Any]:
+    """Construye el contexto del dashboard sin memoización.
+
+    Args:
+        current_path (str): Ruta HTTP actual ya validada.
+
+    Returns:
+        Dict[str, Any]: Contexto descrito en get_dashboard_data.
+    """
     # 1. Normalizar ruta actual
     norm_path = _normalize_path(current_path)
 
@@ -9,11 +9,13 @@ Maneja la lógica de CRUD para equipos, incluyendo:
 
 from typing import Optional, List
 from flask import current_app
+from sqlalchemy import exists, select
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.exc import SQLAlchemyError
 
-from app import Equipo, Usuario
-from app.db import session
+from app.models.equipos_models import Equipo, miembros_equipo
+from app.models.usuarios_models import Usuario
+from app.db import consulta_listado, session
 from app.enums.tipos import EstadoEquipo
 from app.services import usuarios_services
 
@@ -48,10 +50,10 @@ def get_all_equipos() -> List[Equipo]:
     """
     try:
         equipos = (
-            session.query(Equipo)
+            consulta_listado(session.query(Equipo))
             .options(
                 selectinload(Equipo.miembros).joinedload(Usuario.jerarquia),
-                selectinload(Equipo.comandante).joinedload(Usuario.jerarquia),
+                joinedload(Equipo.comandante).joinedload(Usuario.jerarquia),
                 selectinload(Equipo.resultados),
             )
             .all()
@@ -84,15 +86,8 @@ def get_equipos_by_id(id_equipo: int) -> Optional[Equipo]:
         raise TypeError(f"id_equipo debe ser int, recibido {type(id_equipo)}")
 
     try:
-        equipo = (
-            session.query(Equipo)
-            .options(
-                selectinload(Equipo.miembros),
-                joinedload(Equipo.comandante),
-            )
-            .filter_by(id_equipo=id_equipo)
-            .first()
-        )
+        # session.get sirve desde el identity map si el equipo ya está cargado
+        equipo = session.get(Equipo, id_equipo)
 
         if equipo:
             current_app.logger.debug(
@@ -104,6 +99,38 @@ def get_equipos_by_id(id_equipo: int) -> Optional[Equipo]:
         return None
 
 
+def get_equipo_with_members(id_equipo: int) -> Optional[Equipo]:
+    """Retorna un equipo con sus miembros y comandante precargados.
+
+    Variante de `get_equipos_by_id` para las vistas y operaciones que recorren
+    la lista de miembros.
+
+    Args:
+        id_equipo (int): ID del equipo a recuperar.
+
+    Returns:
+        Optional[Equipo]: Objeto Equipo si existe, None en caso contrario.
+
+    Raises:
+        TypeError: Si id_equipo no es un entero válido.
+    """
+    if not isinstance(id_equipo, int):
+        raise TypeError(f"id_equipo debe ser int, recibido {type(id_equipo)}")
+
+    try:
+        return session.get(
+            Equipo,
+            id_equipo,
+            options=[
+                selectinload(Equipo.miembros),
+                joinedload(Equipo.comandante),
+            ],
+        )
+    except SQLAlchemyError as e:
+        current_app.logger.exception(f"Error obteniendo equipo {id_equipo}: {e}")
+        return None
+
+
 # --- FUNCIONES DE CREACIÓN (CREATE) ---
 
 
@@ -372,29 +399,39 @@ def add_member_to_equipo(id_equipo: int, id_usuario: int) -> bool:
     if not isinstance(id_equipo, int) or not isinstance(id_usuario, int):
         raise TypeError("id_equipo e id_usuario deben ser enteros")
 
-    equipo = get_equipos_by_id(id_equipo)
-    if not equipo:
+    # Estado del equipo en una sola consulta, sin cargar la colección de miembros
+    estado = session.execute(
+        select(
+            Equipo.maximo_miembros,
+            Equipo.total_miembros,
+            exists().where(
+                miembros_equipo.c.id_equipo == id_equipo,
+                miembros_equipo.c.id_usuario == id_usuario,
+            ),
+            exists().where(Usuario.id_usuario == id_usuario),
+        ).where(Equipo.id_equipo == id_equipo)
+    ).first()
+    if estado is None:
         raise ValueError(ERROR_EQUIPO_NOT_FOUND)
 
-    usuario = session.query(Usuario).filter_by(id_usuario=id_usuario).first()
-    if not usuario:
+    maximo_miembros, total_miembros, ya_es_miembro, usuario_existe = estado
+    if not usuario_existe:
         raise ValueError(ERROR_USUARIO_NOT_FOUND)
 
+    if ya_es_miembro:
+        current_app.logger.info(
+            f"Usuario {id_usuario} ya es miembro de equipo {id_equipo}"
+        )
+        return True
+
+    if total_miembros >= maximo_miembros:
+        current_app.logger.warning(
+            f"Intento de añadir miembro a equipo {id_equipo} con capacidad llena"
+        )
+        raise ValueError(f"{ERROR_CAPACITY_EXCEEDED} ({maximo_miembros})")
+
     try:
-        # Delegamos la lógica al modelo (Encapsulamiento)
-        try:
-            agregado = equipo.agregar_miembro(usuario)
-            if not agregado:
-                current_app.logger.info(
-                    f"Usuario {id_usuario} ya es miembro de equipo {id_equipo}"
-                )
-                return True
-        except ValueError:
-            # Capturamos el error de capacidad del modelo y lanzamos el mensaje esperado por el controlador
-            current_app.logger.warning(
-                f"Intento de añadir miembro a equipo {id_equipo} con capacidad llena"
-            )
-            raise ValueError(f"{ERROR_CAPACITY_EXCEEDED} ({equipo.maximo_miembros})")
+        Equipo.add_member_by_id(session, id_equipo, id_usuario)
         session.commit()
         current_app.logger.info(
             f"Usuario {id_usuario} añadido como miembro de equipo {id_equipo}"
@@ -433,33 +470,28 @@ def remove_member_from_equipo(id_equipo: int, id_usuario: int) -> bool:
     if not isinstance(id_equipo, int) or not isinstance(id_usuario, int):
         raise TypeError("id_equipo e id_usuario deben ser enteros")
 
-    equipo = get_equipos_by_id(id_equipo)
-    if not equipo:
+    id_comandante = session.scalar(
+        select(Equipo.id_comandante).where(Equipo.id_equipo == id_equipo)
+    )
+    if id_comandante is None:
         raise ValueError(ERROR_EQUIPO_NOT_FOUND)
 
-    usuario = session.query(Usuario).filter_by(id_usuario=id_usuario).first()
-    if not usuario:
-        return True  # Nada que remover
+    # Proteger al comandante
+    if id_comandante == id_usuario:
+        current_app.logger.warning(
+            f"Intento de remover comandante {id_usuario} del equipo {id_equipo}"
+        )
+        raise ValueError(ERROR_COMANDANTE_CANNOT_REMOVE)
 
     try:
-        # Proteger al comandante
-        if equipo.es_comandante(id_usuario):
-            current_app.logger.warning(
-                f"Intento de remover comandante {id_usuario} del equipo {id_equipo}"
-            )
-            raise ValueError(ERROR_COMANDANTE_CANNOT_REMOVE)
-
-        # Delegamos la remoción al modelo
-        removido = equipo.remover_miembro(usuario)
-
-        if removido:
+        # DELETE directo sobre la tabla de asociación
+        if Equipo.remove_member_by_id(session, id_equipo, id_usuario):
             session.commit()
             current_app.logger.info(
                 f"Usuario {id_usuario} removido del equipo {id_equipo}"
             )
-            return True
 
-        return True  # Ya no era miembro
+        return True  # Removido o ya no era miembro
 
     except SQLAlchemyError as e:
         session.rollback()
@@ -10,7 +10,7 @@ Maneja la lógica de CRUD para jerarquías, incluyendo:
 
 from typing import Optional, List
 from flask import current_app
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import selectinload, joinedload, undefer_group
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.db import session
@@ -51,7 +51,9 @@ def get_all_jerarquias() -> List[Jerarquia]:
     """
     try:
         jerarquias = (
-            session.query(Jerarquia).options(selectinload(Jerarquia.protocolos)).all()
+            session.query(Jerarquia)
+            .options(selectinload(Jerarquia.protocolos), undefer_group("detalles"))
+            .all()
         )
         current_app.logger.debug(f"Se obtuvieron {len(jerarquias)} jerarquías")
         return jerarquias
@@ -84,7 +86,7 @@ def get_jerarquia_by_id(id_jerarquia: int) -> Optional[Jerarquia]:
         jerarquia = (
             session.query(Jerarquia)
             .filter_by(id_jerarquia=id_jerarquia)
-            .options(selectinload(Jerarquia.protocolos))
+            .options(selectinload(Jerarquia.protocolos), undefer_group("detalles"))
             .first()
         )
         return jerarquia
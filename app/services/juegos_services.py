@@ -11,7 +11,7 @@ from flask import current_app
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.db import session
-from app import Juego
+from app.models.juegos_models import Juego
 
 
 # --- CONSTANTES DE ERROR ---
@@ -120,6 +120,9 @@ def delete_game(id_juego: int) -> bool:
         if not juego:
             raise ValueError(ERROR_GAME_NOT_FOUND)
         current_app.logger.info(f"Eliminando juego ID={id_juego}")
+        # `Juego.torneos` es write_only: la cascada se aplica torneo a torneo
+        for torneo in session.scalars(juego.torneos.select()):
+            session.delete(torneo)
         session.delete(juego)
         session.commit()
         return True
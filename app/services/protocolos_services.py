@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -46,6 +46,19 @@ def get_protocolo_by_id(id_protocolo: int) -> Optional[Protocolo]:
     return session.query(Protocolo).filter_by(id_protocolo=id_protocolo).first()
 
 
+def get_protocolos_by_ids(ids: Iterable) -> List[Protocolo]:
+    """Busca varios protocolos con un único `IN`.
+
+    Los IDs ausentes se ignoran. Acepta los valores crudos del formulario:
+    los que no son numéricos no coinciden con ningún protocolo y se descartan.
+    """
+    ids = {int(i) for i in ids if str(i).isdigit()}
+    if not ids:
+        return []
+    current_app.logger.debug("Buscando protocolos ids=%s", sorted(ids))
+    return session.query(Protocolo).filter(Protocolo.id_protocolo.in_(ids)).all()
+
+
 def create_protocol(
     codigo_protocolo: str,
     nombre_protocolo: str,
@@ -8,7 +8,7 @@ from typing import Optional, List
 from flask import current_app
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.db import session
+from app.db import consulta_listado, session
 from app.models.roles_models import Rol
 
 
@@ -26,7 +26,7 @@ def get_all_roles() -> List[Rol]:
     """Retorna todos los roles disponibles."""
     try:
         current_app.logger.debug("Obteniendo todos los roles")
-        roles = session.query(Rol).all()
+        roles = consulta_listado(session.query(Rol)).all()
         current_app.logger.debug(f"{len(roles)} roles encontrados")
         return roles
     except SQLAlchemyError as e:
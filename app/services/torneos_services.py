@@ -3,7 +3,7 @@
 Agrupa la lógica CRUD para los torneos que se organizan en la plataforma.
 
 Funciones principales:
-- Listar todos los torneos, con sus juegos y registros precargados
+- Listar todos los torneos, con sus juegos y conteos precargados
 - Consultar un torneo por ID
 - Crear, actualizar (parcial) y eliminar torneos
 - Validaciones de entrada, conversiones de tipos y manejo de estados
@@ -17,11 +17,11 @@ enum `EstadoTorneo`.
 from datetime import datetime
 from typing import Optional, List
 from flask import current_app
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import undefer_group
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.db import session
-from app import Torneo
+from app.db import consulta_listado, session
+from app.models.torneos_models import Torneo
 from app.enums.tipos import EstadoTorneo
 
 
@@ -36,12 +36,12 @@ ERROR_DATABASE = "Error en la base de datos"
 # --- CONSULTAS (READ) ---
 
 def get_all_torneos() -> List[Torneo]:
-    """Retorna todos los torneos con juego y registros precargados."""
+    """Retorna todos los torneos con juego y conteos precargados."""
     try:
         current_app.logger.debug("Obteniendo todos los torneos")
         torneos = (
-            session.query(Torneo)
-            .options(joinedload(Torneo.juego), selectinload(Torneo.registros))
+            consulta_listado(session.query(Torneo), Torneo.juego)
+            .options(undefer_group("metricas"))
             .all()
         )
         current_app.logger.debug(f"{len(torneos)} torneos encontrados")
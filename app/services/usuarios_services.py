@@ -13,11 +13,13 @@ Principales responsabilidades:
 
 from typing import Optional, Tuple, List
 from flask import current_app
+from sqlalchemy import exists, func
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import SQLAlchemyError
 
-from app import Usuario
-from app.db import session
+from app.models.usuarios_models import Usuario
+from app.models.equipos_models import miembros_equipo
+from app.db import consulta_listado, session
 from werkzeug.security import generate_password_hash, check_password_hash
 
 # --- CONSTANTES DE ERROR ---
@@ -41,9 +43,11 @@ def get_all_usuarios() -> List[Usuario]:
         SQLAlchemyError: en caso de error de base de datos.
     """
     try:
-        usuarios = session.query(Usuario).options(
-            joinedload(Usuario.jerarquia)
-        ).all()
+        usuarios = (
+            consulta_listado(session.query(Usuario))
+            .options(joinedload(Usuario.jerarquia))
+            .all()
+        )
         current_app.logger.debug(f"Obtenidos {len(usuarios)} usuarios")
         return usuarios
     except SQLAlchemyError as e:
@@ -52,19 +56,21 @@ def get_all_usuarios() -> List[Usuario]:
 
 
 def get_available_users_paginated(
-    excluded_ids: Optional[List[int]],
+    id_equipo: Optional[int],
     page: int,
-    per_page: int
-) -> Tuple[List[Usuario], int]:
-    """Obtiene usuarios paginados excluyendo ciertos IDs.
+    per_page: int,
+) -> Tuple[List[Usuario], int, int]:
+    """Obtiene usuarios paginados que no pertenecen a un equipo.
 
     Args:
-        excluded_ids: lista de IDs de usuarios a excluir (por ejemplo, ya en equipo).
+        id_equipo: equipo cuyos miembros se excluyen con un `NOT EXISTS`
+            sobre `miembros_equipo`; None no excluye a nadie.
         page: número de página (1-based).
         per_page: cantidad de elementos por página.
 
     Returns:
-        tuple: (lista de usuarios, total de registros antes de paginar).
+        tuple: (lista de usuarios, total de registros antes de paginar,
+            total de páginas).
 
     Raises:
         SQLAlchemyError: si ocurre un error en la consulta.
@@ -72,16 +78,38 @@ def get_available_users_paginated(
     try:
         query = session.query(Usuario).options(joinedload(Usuario.jerarquia))
 
-        if excluded_ids:
-            query = query.filter(Usuario.id_usuario.notin_(excluded_ids))
-
-        total = query.count()
-        items = query.offset((page - 1) * per_page).limit(per_page).all()
-
-        return items, total
+        if id_equipo is not None:
+            query = query.filter(
+                ~exists().where(
+                    miembros_equipo.c.id_usuario == Usuario.id_usuario,
+                    miembros_equipo.c.id_equipo == id_equipo,
+                )
+            )
+
+        # Filas y total en un solo viaje: COUNT(*) OVER () se evalúa antes
+        # del LIMIT/OFFSET, así que cada fila trae el total sin paginar.
+        filas = (
+            query.add_columns(func.count().over().label("total"))
+            .order_by(Usuario.id_usuario)
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+            .all()
+        )
+        items = [fila[0] for fila in filas]
+        if filas:
+            total = filas[0].total
+        elif page > 1:
+            # Página fuera de rango: no hay filas de las que leer el total
+            total = query.count()
+        else:
+            total = 0
+
+        # División entera con redondeo hacia arriba
+        total_pages = -(-total // per_page) if per_page else 0
+        return items, total, total_pages
     except SQLAlchemyError as e:
         current_app.logger.exception(f"Error en paginación de usuarios: {e}")
-        return [], 0
+        return [], 0, 0
 
 
 def get_usuarios_by_id(id_usuario: int) -> Optional[Usuario]:
@@ -9,6 +9,9 @@ def permission_required(*allowed_levels):
     El ADMIN (100) siempre tiene acceso implícito.
     Uso: @permission_required(Permissions.MOD_TACTICO, Permissions.ADMIN)
     """
+    # Se resuelve una sola vez al decorar, no en cada request
+    allowed = frozenset(allowed_levels)
+
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
@@ -22,7 +25,7 @@ def permission_required(*allowed_levels):
             # 2. Verificación de Permisos (Lista Exacta + Admin Implícito)
             # Si el usuario es MENOR a Admin (90) Y su nivel NO está en la lista permitida...
             # Esto permite que niveles 90, 95, 100, etc. tengan acceso total.
-            if user_level < Permissions.ADMIN and user_level not in allowed_levels:
+            if user_level < Permissions.ADMIN and user_level not in allowed:
                 flash(
                     "ACCESO DENEGADO: Credenciales insuficientes para esta operación.",
                     "danger",
@@ -16,10 +16,15 @@ class Config:
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Filas por sentencia en los INSERT multi-VALUES (bulk_insert de los modelos)
+    SQLALCHEMY_ENGINE_OPTIONS = {"insertmanyvalues_page_size": 10_000}
+
 
 class ProdConfig(Config):
     DEBUG = False
     TESTING = False
+    TEMPLATES_AUTO_RELOAD = False
+    EXPLAIN_TEMPLATE_LOADING = False
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SECURE = True
 